@@ -0,0 +1,21 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# Copyright (c) 2025 Artur Flamandzki
+
+# fixed_point is run as a script directory (``python __init__.py`` imports
+# ``trig_engine``), so the tests under it need it on sys.path.
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixed_point"))
+
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _reference_cache(tmp_path_factory):
+    # reference tables are cached in a temporary directory, not the user cache
+    from trig_engine import diagnostics
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(diagnostics, "REFERENCE_CACHE", str(tmp_path_factory.mktemp("cache")))
+        yield
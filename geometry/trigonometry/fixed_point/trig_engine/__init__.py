@@ -0,0 +1,12 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# Copyright (c) 2025 Artur Flamandzki
+
+"""
+Reference implementation of the small-angle fixed-point oscillator.
+
+    engine         Q1.60 rotation oscillator in Python integers
+    batched        K oscillators at once in NumPy int64 (split-limb products)
+    diagnostics    errors against the phase accumulator
+    visualization  plots of a run and of benchmark rows (matplotlib, lazy)
+    benchmark      timings against CORDIC, LUT, math and numpy baselines
+"""
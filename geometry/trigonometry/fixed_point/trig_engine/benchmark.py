@@ -0,0 +1,287 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# Copyright (c) 2025 Artur Flamandzki
+
+"""
+Timing of the oscillator against other ways of producing cos / sin.
+
+For a run of n samples every method produces cos / sin of the phases
+k·theta, k = 0 .. n-1, with theta = 0.618 turn per run: an irrational
+fraction of the circle, so no run lines its phases up with the nodes of
+the lookup table (one turn per run would, for n dividing 4096):
+
+    engine        the Q1.60 oscillator (generates the phases itself)
+    cordic        CORDIC rotation in Q1.60 integers, one iteration per bit
+    lut_interp    4096-entry Q1.60 sine table with linear interpolation
+    math          math.cos / math.sin in a Python loop
+    numpy         numpy.cos / numpy.sin on an array
+
+Phases are prepared outside the timed region, in the form each method
+takes.  Each method runs ``warmup`` untimed times, then ``trials`` timed
+times.  The max error is taken against cos / sin of the phases evaluated
+in integers to 2^-120: rows of ``diagnostics.reference_table``, built at
+about 3 µs a sample the first time and read back from the table cache
+(REFERENCE_CACHE) on later sweeps.
+
+Every row is a dict: method, n, ns_per_sample (median), min_ns_per_sample,
+samples_per_sec, max_error, trials.  ``write_rows`` stores rows as JSON
+or CSV:
+
+    python -m trig_engine.benchmark [--sizes N ...] [--trials T]
+                                    [--output rows.json|rows.csv] [--plot PATH]
+"""
+
+import argparse
+import csv
+import json
+import math
+import statistics
+import sys
+import time
+from math import isqrt
+
+import numpy as np
+
+from trig_engine.diagnostics import reference_table, table_reference
+from trig_engine.engine import (
+    GUARD, ONE, PI, Q, OscillatorState, default_theta, generate, make_rotation,
+    pi_scaled, sin_cos,
+)
+
+TWO_PI = 2 * PI
+ROW_FIELDS = ("method", "n", "ns_per_sample", "min_ns_per_sample",
+              "samples_per_sec", "max_error", "trials")
+
+# Turns per run: the golden ratio conjugate, far from any fraction k/4096.
+TURNS_PER_RUN = (math.sqrt(5) - 1) / 2
+
+
+# ------------------------------------------------------------
+# CORDIC (Q1.60)
+# ------------------------------------------------------------
+
+def _atan_pow2(i: int, q: int = Q) -> int:
+    """atan(2^-i) scaled by 2^q."""
+    if i == 0:
+        return PI // 4
+    bits = q + GUARD
+    t = (1 << bits) >> i
+    t2 = t * t >> bits
+    total, term, k = 0, t, 1
+    while term:
+        total += term // k if k % 4 == 1 else -(term // k)
+        term = term * t2 >> bits
+        k += 2
+    return (total + (1 << (GUARD - 1))) >> GUARD
+
+
+CORDIC_ANGLES = [_atan_pow2(i) for i in range(Q)]
+
+
+def _cordic_gain(q: int = Q) -> int:
+    """Product of 1 / sqrt(1 + 2^-2i) over the iterations, scaled by 2^q."""
+    num = den = 1
+    for i in range(Q):
+        num <<= 2 * i
+        den *= (1 << (2 * i)) + 1
+    return isqrt((num << (2 * q)) // den)
+
+
+CORDIC_GAIN = _cordic_gain()
+
+
+def cordic(phase: int):
+    """(cos, sin) of ``phase`` (Q1.60, within [-pi, pi]) by CORDIC."""
+    negate = False
+    if phase > PI // 2:
+        phase, negate = phase - PI, True
+    elif phase < -(PI // 2):
+        phase, negate = phase + PI, True
+    x, y, z = CORDIC_GAIN, 0, phase
+    for i, angle in enumerate(CORDIC_ANGLES):
+        if z >= 0:
+            x, y, z = x - (y >> i), y + (x >> i), z - angle
+        else:
+            x, y, z = x + (y >> i), y - (x >> i), z + angle
+    return (-x, -y) if negate else (x, y)
+
+
+# ------------------------------------------------------------
+# Lookup table with linear interpolation (Q1.60)
+# ------------------------------------------------------------
+
+LUT_BITS = 12
+LUT_SIZE = 1 << LUT_BITS
+
+
+def _sine_table():
+    wide = Q + GUARD
+    two_pi = 2 * pi_scaled(wide)
+    table = []
+    for k in range(LUT_SIZE + 1):
+        angle = two_pi * k // LUT_SIZE
+        if angle > two_pi // 2:
+            angle -= two_pi
+        table.append((sin_cos(angle, wide)[0] + (1 << (GUARD - 1))) >> GUARD)
+    return table
+
+
+SINE_TABLE = _sine_table()
+
+
+def lut_sin(phase: int) -> int:
+    """sin of ``phase`` (Q1.60, within [0, 2·pi)) from the table."""
+    index, rest = divmod(phase * LUT_SIZE, TWO_PI)
+    lo = SINE_TABLE[index]
+    return lo + (SINE_TABLE[index + 1] - lo) * rest // TWO_PI
+
+
+def lut_sin_cos(phase: int):
+    """(cos, sin) of ``phase`` (Q1.60, within [0, 2·pi))."""
+    quarter = phase + PI // 2
+    if quarter >= TWO_PI:
+        quarter -= TWO_PI
+    return lut_sin(quarter), lut_sin(phase)
+
+
+# ------------------------------------------------------------
+# Methods: prepare(n, rot) -> callable returning (cos values, sin values)
+# ------------------------------------------------------------
+
+def _phases(n: int, theta: int):
+    """Phases k·theta reduced to [-pi, pi), as Q1.60 ints."""
+    return [(k * theta + PI) % TWO_PI - PI for k in range(n)]
+
+
+def _prepare_engine(n, rot):
+    def run():
+        xs, ys, _ = generate(OscillatorState(), rot, n)
+        return xs, ys
+    return run
+
+
+def _prepare_cordic(n, rot):
+    phases = _phases(n, rot.theta)
+
+    def run():
+        pairs = [cordic(p) for p in phases]
+        return [c for c, _ in pairs], [s for _, s in pairs]
+    return run
+
+
+def _prepare_lut(n, rot):
+    phases = [p + TWO_PI if p < 0 else p for p in _phases(n, rot.theta)]
+
+    def run():
+        pairs = [lut_sin_cos(p) for p in phases]
+        return [c for c, _ in pairs], [s for _, s in pairs]
+    return run
+
+
+def _prepare_math(n, rot):
+    phases = [p / ONE for p in _phases(n, rot.theta)]
+    cos, sin = math.cos, math.sin
+
+    def run():
+        return [cos(p) for p in phases], [sin(p) for p in phases]
+    return run
+
+
+def _prepare_numpy(n, rot):
+    phases = np.array(_phases(n, rot.theta), dtype=np.int64) / ONE
+
+    def run():
+        return np.cos(phases), np.sin(phases)
+    return run
+
+
+METHODS = {
+    "engine": _prepare_engine,
+    "cordic": _prepare_cordic,
+    "lut_interp": _prepare_lut,
+    "math": _prepare_math,
+    "numpy": _prepare_numpy,
+}
+
+
+def bench_theta(n: int) -> int:
+    """Phase increment of a run of ``n`` samples (TURNS_PER_RUN turns)."""
+    return round(default_theta(max(n, 8)) * TURNS_PER_RUN)
+
+
+def _reference(n: int, theta: int):
+    """(cos_hi, cos_lo, sin_hi, sin_lo) of k·theta, as float_reference returns."""
+    return table_reference(reference_table(theta, n))
+
+
+def _max_error(values, hi, lo) -> float:
+    """Max |value - reference| for Q1.60 ints or floats, in natural units."""
+    values = np.asarray(values)
+    if values.dtype.kind == "f":
+        return float(np.abs(values - (hi + lo) / ONE).max())
+    return float(np.abs((values.astype(np.int64) - hi) - lo).max()) / ONE
+
+
+def benchmark(sizes, trials: int = 5, warmup: int = 1, methods=None) -> list:
+    """Rows of timings of ``methods`` (default: all) for each run length."""
+    rows = []
+    for n in sizes:
+        rot = make_rotation(bench_theta(n))
+        cos_hi, cos_lo, sin_hi, sin_lo = _reference(n, rot.theta)
+        for name in methods or METHODS:
+            run = METHODS[name](n, rot)
+            for _ in range(warmup):
+                run()
+            times = []
+            for _ in range(trials):
+                t = time.perf_counter()
+                cos_values, sin_values = run()
+                times.append(time.perf_counter() - t)
+            median = statistics.median(times)
+            rows.append({
+                "method": name,
+                "n": n,
+                "ns_per_sample": median * 1e9 / n,
+                "min_ns_per_sample": min(times) * 1e9 / n,
+                "samples_per_sec": n / median if median else math.inf,
+                "max_error": max(_max_error(cos_values, cos_hi, cos_lo),
+                                 _max_error(sin_values, sin_hi, sin_lo)),
+                "trials": trials,
+            })
+    return rows
+
+
+def write_rows(rows, path: str):
+    """Write ``rows`` as CSV when ``path`` ends in .csv, otherwise JSON."""
+    with open(path, "w", newline="") as f:
+        if path.endswith(".csv"):
+            writer = csv.DictWriter(f, fieldnames=ROW_FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+        else:
+            json.dump(rows, f, indent=1)
+            f.write("\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m trig_engine.benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[128, 256, 500, 1000, 2000])
+    parser.add_argument("--trials", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--methods", nargs="+", choices=list(METHODS), default=None)
+    parser.add_argument("--output", default=None, help="rows as .json or .csv")
+    parser.add_argument("--plot", default=None, help="save the benchmark plot here")
+    args = parser.parse_args(argv)
+
+    rows = benchmark(args.sizes, args.trials, args.warmup, args.methods)
+    if args.output:
+        write_rows(rows, args.output)
+    sys.stdout.writelines(
+        f"{r['method']:>10} {r['n']:>6} {r['ns_per_sample']:>10.1f} ns "
+        f"{r['samples_per_sec']:>12.3e} /s  err {r['max_error']:.2e}\n" for r in rows)
+    if args.plot:
+        from trig_engine.visualization import plot_benchmark
+        plot_benchmark(rows, args.plot)
+
+
+if __name__ == "__main__":
+    main()
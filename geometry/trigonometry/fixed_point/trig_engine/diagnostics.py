@@ -0,0 +1,487 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# Copyright (c) 2025 Artur Flamandzki
+
+"""
+Error report of an oscillator run against its phase accumulator.
+
+Each sample (x, y) is compared with (cos a, sin a), where ``a`` is the
+exact accumulated phase.  Errors are taken in Q1.60 integers where
+possible:
+
+    - the reference is an (hi, lo) pair: the nearest Q1.60 integer and
+      the float remainder in units of 2^-60, so x - ref is formed
+      exactly before it is rounded to float,
+    - the amplitude error (x² + y² - 1) / 2 is formed from 30-bit limbs
+      and needs no reference at all,
+    - the phase drift is the cross product of the sample with the
+      reference direction.
+
+The reference comes from float64 math (``float_reference``, good to
+about 1e-16, the default) or from a reference table (``reference_table``):
+cos / sin of k·theta evaluated in integers to 2^-bits, stored as two
+int64 words per value (the Q1.60 integer and the remainder below it).
+Tables are cached in $TRIG_ENGINE_CACHE, by default the trig_engine
+directory of the user cache ($XDG_CACHE_HOME or ~/.cache), as ``.npy``
+files opened memory-mapped and reused for any sub-range of the steps
+they cover; an empty $TRIG_ENGINE_CACHE keeps tables in memory.
+
+A ``StreamValidator`` keeps only running sums and maxima plus one
+averaged block spectrum (for the SFDR), so runs of any length are
+validated in constant memory; ``validate_stream`` feeds it chunk by
+chunk and checkpoints it to a JSON file it can resume from:
+
+    python -m trig_engine.diagnostics [steps] [checkpoint.json]
+
+The checkpoint defaults to validation_checkpoint.json in the table cache
+(in the temporary directory when tables are not cached).
+"""
+
+import glob
+import json
+import math
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from trig_engine.engine import (
+    GUARD, ONE, PI, Q, OscillatorState, default_theta, generate, make_rotation,
+    seek, sin_cos_at,
+)
+
+TWO_PI = 2 * PI
+LIMB = 30
+MASK = (1 << LIMB) - 1
+
+FFT_SIZE = 4096
+# Kaiser window: side lobes near -280 dB, main lobe about beta/pi bins wide.
+KAISER_BETA = 30.0
+
+
+def default_cache_dir(environ=os.environ):
+    """Directory for cached reference tables, or None for in-memory tables."""
+    if "TRIG_ENGINE_CACHE" in environ:
+        return environ["TRIG_ENGINE_CACHE"] or None
+    base = environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "trig_engine")
+
+
+# Directory of cached reference tables; None keeps tables in memory.
+REFERENCE_CACHE = default_cache_dir()
+REFERENCE_DTYPE = np.dtype([("cos_hi", np.int64), ("cos_lo", np.int64),
+                            ("sin_hi", np.int64), ("sin_lo", np.int64)])
+REFERENCE_BITS = 120
+# Steps between exact evaluations while a table is built.
+_TABLE_ANCHOR = 4096
+
+
+def reduce_phases(accums) -> np.ndarray:
+    """Phases ``accums`` reduced to [-pi, pi), as Q1.60 int64."""
+    return np.array([(a + PI) % TWO_PI - PI for a in accums], dtype=np.int64)
+
+
+def float_reference(phases: np.ndarray):
+    """
+    cos / sin of Q1.60 ``phases`` from float64 math, as ``(cos_hi, cos_lo,
+    sin_hi, sin_lo)``: int64 Q1.60 values and float64 remainders in units
+    of 2^-60.  The phase is split into its float value and the integer
+    rest, which is applied to first order.
+    """
+    head = phases.astype(np.float64)
+    rest = (phases - head.astype(np.int64)).astype(np.float64) / ONE
+    head /= ONE
+    c, s = np.cos(head), np.sin(head)
+    cos_v = (c - s * rest) * ONE
+    sin_v = (s + c * rest) * ONE
+    cos_hi, sin_hi = np.rint(cos_v).astype(np.int64), np.rint(sin_v).astype(np.int64)
+    return cos_hi, cos_v - cos_hi, sin_hi, sin_v - sin_hi
+
+
+def _table_path(cache_dir, theta, bits, start, stop):
+    return os.path.join(cache_dir, f"ref_{theta}_{bits}_{start}_{stop}.npy")
+
+
+def _fill_table(table, theta, start, bits):
+    wide = bits + GUARD
+    s1, c1 = sin_cos_at(theta, 1, wide)
+    half, shift = 1 << (wide - 1), bits - Q
+    count = len(table)
+    for lo in range(0, count, _TABLE_ANCHOR):
+        n = min(_TABLE_ANCHOR, count - lo)
+        S, C = sin_cos_at(theta, start + lo, wide)
+        block = []
+        for _ in range(n):
+            c = (C + (1 << (GUARD - 1))) >> GUARD
+            s = (S + (1 << (GUARD - 1))) >> GUARD
+            ch = (c + (1 << (shift - 1))) >> shift
+            sh = (s + (1 << (shift - 1))) >> shift
+            block.append((ch, c - (ch << shift), sh, s - (sh << shift)))
+            C, S = (C * c1 - S * s1 + half) >> wide, (C * s1 + S * c1 + half) >> wide
+        table[lo:lo + n] = block
+    return table
+
+
+def _build_table(path, theta, start, count, bits):
+    """Write the table to a private temporary file, then rename it to ``path``."""
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".npy.tmp")
+    os.close(fd)
+    try:
+        table = np.lib.format.open_memmap(tmp, mode="w+", dtype=REFERENCE_DTYPE,
+                                          shape=(count,))
+        _fill_table(table, theta, start, bits)
+        table.flush()
+        del table
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def reference_table(theta: int, count: int, start: int = 0,
+                    bits: int = REFERENCE_BITS, cache_dir: str = None) -> np.ndarray:
+    """
+    Rows ``start`` .. ``start + count - 1`` of the reference table of
+    ``theta`` at ``bits`` bits (60 < bits <= 123).
+
+    Row k holds cos / sin of k·theta as ``*_hi`` (Q1.60) plus ``*_lo``
+    (units of 2^-bits); rows are built at about 3 µs each, re-anchored
+    exactly every few thousand rows.  In ``cache_dir`` (default
+    REFERENCE_CACHE) a cached table covering the range is sliced
+    memory-mapped; otherwise one is built, written atomically and kept.
+    Without a cache directory the table is built in memory and nothing
+    is written.
+    """
+    if not 60 < bits <= 123:
+        raise ValueError("reference tables hold 60 < bits <= 123")
+    cache_dir = cache_dir or REFERENCE_CACHE
+    if not cache_dir:
+        return _fill_table(np.empty(count, dtype=REFERENCE_DTYPE), theta, start, bits)
+    stop = start + count
+    for path in glob.glob(os.path.join(cache_dir, f"ref_{theta}_{bits}_*_*.npy")):
+        lo, hi = map(int, os.path.basename(path)[:-4].split("_")[-2:])
+        if lo <= start and stop <= hi:
+            return np.load(path, mmap_mode="r")[start - lo:stop - lo]
+    os.makedirs(cache_dir, exist_ok=True)
+    path = _table_path(cache_dir, theta, bits, start, stop)
+    _build_table(path, theta, start, count, bits)
+    return np.load(path, mmap_mode="r")
+
+
+def table_reference(rows: np.ndarray, bits: int = REFERENCE_BITS):
+    """``rows`` of a reference table in the form ``float_reference`` returns."""
+    scale = 2.0 ** (bits - Q)
+    return (np.asarray(rows["cos_hi"]), rows["cos_lo"] / scale,
+            np.asarray(rows["sin_hi"]), rows["sin_lo"] / scale)
+
+
+def amplitude_error(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """(x² + y² - 1) / 2 of Q1.60 samples, in units of 2^-60."""
+    xh, xl = x >> LIMB, x & MASK
+    yh, yl = y >> LIMB, y & MASK
+    top = (xh * xh + yh * yh - (1 << (2 * LIMB))).astype(np.float64)
+    mid = (2 * (xh * xl + yh * yl)).astype(np.float64)
+    low = (xl * xl + yl * yl).astype(np.float64)
+    return (top * 2.0 ** 60 + mid * 2.0 ** 30 + low) / 2.0 ** 61
+
+
+class StreamValidator:
+    """
+    Running error statistics of a stream of samples.
+
+    Errors are accumulated in units of 2^-60 and reported in natural
+    units (radians / unit amplitude) by ``summary``.  Validators of
+    consecutive ranges combine with ``merge`` when every range but the
+    last is a whole number of FFT blocks.
+    """
+
+    _SUMS = ("sum_x", "sum_y", "sq_x", "sq_y", "sum_amp", "sq_amp", "sum_drift")
+    _MAXES = ("max_x", "max_y", "max_amp", "max_drift")
+
+    def __init__(self, fft_size: int = FFT_SIZE):
+        self.fft_size = fft_size
+        self.samples = 0
+        for name in self._SUMS + self._MAXES:
+            setattr(self, name, 0.0)
+        self.last_drift = 0.0
+        self.blocks = 0
+        self.spectrum = np.zeros(fft_size)
+        self.pending = np.zeros(0, dtype=np.complex128)
+        self._window = np.kaiser(fft_size, KAISER_BETA)
+
+    def update(self, xs, ys, accums, reference=None):
+        """
+        Add a chunk of Q1.60 samples and their phase accumulators.
+
+        ``reference`` is the chunk's ``(cos_hi, cos_lo, sin_hi, sin_lo)``
+        (see ``table_reference``); by default ``float_reference``.
+        """
+        if not len(xs):
+            return
+        x = np.asarray(xs, dtype=np.int64)
+        y = np.asarray(ys, dtype=np.int64)
+        if reference is None:
+            reference = float_reference(reduce_phases(accums))
+        cos_hi, cos_lo, sin_hi, sin_lo = reference
+        ex = (x - cos_hi) - cos_lo
+        ey = (y - sin_hi) - sin_lo
+        amp = amplitude_error(x, y)
+        drift = (ey * cos_hi - ex * sin_hi) / ONE
+
+        self.samples += len(x)
+        self.sum_x += ex.sum()
+        self.sum_y += ey.sum()
+        self.sq_x += ex @ ex
+        self.sq_y += ey @ ey
+        self.sum_amp += amp.sum()
+        self.sq_amp += amp @ amp
+        self.sum_drift += drift.sum()
+        self.max_x = max(self.max_x, np.abs(ex).max())
+        self.max_y = max(self.max_y, np.abs(ey).max())
+        self.max_amp = max(self.max_amp, np.abs(amp).max())
+        self.max_drift = max(self.max_drift, np.abs(drift).max())
+        self.last_drift = float(drift[-1])
+
+        z = np.concatenate((self.pending, (x + 1j * y) / ONE))
+        full = len(z) - len(z) % self.fft_size
+        if full:
+            blocks = z[:full].reshape(-1, self.fft_size) * self._window
+            self.spectrum += (np.abs(np.fft.fft(blocks, axis=1)) ** 2).sum(axis=0)
+            self.blocks += len(blocks)
+        self.pending = z[full:]
+
+    def merge(self, other: "StreamValidator"):
+        """Append the statistics of the range following this one."""
+        if len(self.pending):
+            raise ValueError("only a whole number of FFT blocks can be followed")
+        self.samples += other.samples
+        for name in self._SUMS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        for name in self._MAXES:
+            setattr(self, name, max(getattr(self, name), getattr(other, name)))
+        if other.samples:
+            self.last_drift = other.last_drift
+        self.blocks += other.blocks
+        self.spectrum += other.spectrum
+        self.pending = other.pending
+
+    def sfdr_db(self):
+        """Carrier to strongest spur of the averaged spectrum, in dB."""
+        if not self.blocks:
+            return None
+        power = self.spectrum
+        peak = int(np.argmax(power))
+        lobe = int(KAISER_BETA / math.pi) + 3
+        bins = (np.arange(self.fft_size) - peak + self.fft_size // 2) % self.fft_size
+        spurs = power[np.abs(bins - self.fft_size // 2) > lobe]
+        spur = spurs.max() if len(spurs) else 0.0
+        return math.inf if spur <= 0 else 10 * math.log10(power[peak] / spur)
+
+    def summary(self) -> dict:
+        n = self.samples or 1
+        rms = lambda sq: math.sqrt(sq / n) / ONE
+        return {
+            "samples": self.samples,
+            "max_err_x": self.max_x / ONE,
+            "max_err_y": self.max_y / ONE,
+            "rms_err_x": rms(self.sq_x),
+            "rms_err_y": rms(self.sq_y),
+            "bias_x": self.sum_x / n / ONE,
+            "bias_y": self.sum_y / n / ONE,
+            "max_amplitude_err": self.max_amp / ONE,
+            "rms_amplitude_err": rms(self.sq_amp),
+            "amplitude_bias": self.sum_amp / n / ONE,
+            "max_phase_drift": self.max_drift / ONE,
+            "phase_bias": self.sum_drift / n / ONE,
+            "final_phase_drift": self.last_drift / ONE,
+            "sfdr_db": self.sfdr_db(),
+        }
+
+    def to_dict(self) -> dict:
+        names = ("fft_size", "samples", "last_drift", "blocks") + self._SUMS + self._MAXES
+        state = {name: getattr(self, name) for name in names}
+        state = {k: v.item() if isinstance(v, np.generic) else v for k, v in state.items()}
+        state["spectrum"] = self.spectrum.tolist()
+        state["pending"] = [self.pending.real.tolist(), self.pending.imag.tolist()]
+        return state
+
+    @classmethod
+    def from_dict(cls, state: dict):
+        validator = cls(state["fft_size"])
+        for name, value in state.items():
+            if name not in ("fft_size", "spectrum", "pending"):
+                setattr(validator, name, value)
+        validator.spectrum = np.array(state["spectrum"])
+        re, im = state["pending"]
+        validator.pending = np.array(re) + 1j * np.array(im)
+        return validator
+
+
+def _fft_size_for(n: int) -> int:
+    return min(FFT_SIZE, 1 << max(n.bit_length() - 1, 0))
+
+
+def _progression(accums):
+    """(theta, first step) when ``accums`` are k·theta for consecutive k."""
+    if len(accums) < 2:
+        return None
+    theta = int(accums[1]) - int(accums[0])
+    first = int(accums[0])
+    if theta == 0 or first % theta or int(accums[-1]) - first != theta * (len(accums) - 1):
+        return None
+    return theta, first // theta
+
+
+def compute_errors(xs, ys, accums, reference: str = "float") -> dict:
+    """
+    Error summary of one run held in memory.
+
+    With ``reference="table"`` (and unwrapped accumulators of one
+    oscillator) a reference table is used, otherwise float64.
+    """
+    validator = StreamValidator(_fft_size_for(len(xs)))
+    run = _progression(accums) if reference == "table" else None
+    table = None
+    if run is not None:
+        table = table_reference(reference_table(run[0], len(xs), run[1]))
+    validator.update(xs, ys, accums, table)
+    return validator.summary()
+
+
+def _format_summary(errors: dict):
+    sfdr = errors["sfdr_db"]
+    return [
+        f"Samples                 : {errors['samples']}\n",
+        f"Max |x - cos|           : {errors['max_err_x']:.3e}\n",
+        f"Max |y - sin|           : {errors['max_err_y']:.3e}\n",
+        f"RMS x / y error         : {errors['rms_err_x']:.3e} / {errors['rms_err_y']:.3e}\n",
+        f"Bias x / y              : {errors['bias_x']:.3e} / {errors['bias_y']:.3e}\n",
+        f"Max amplitude error     : {errors['max_amplitude_err']:.3e}\n",
+        f"Amplitude bias          : {errors['amplitude_bias']:.3e}\n",
+        f"Max phase drift [rad]   : {errors['max_phase_drift']:.3e}\n",
+        f"Final phase drift [rad] : {errors['final_phase_drift']:.3e}\n",
+        f"SFDR [dB]               : {'n/a' if sfdr is None else f'{sfdr:.1f}'}\n",
+    ]
+
+
+def report_errors(xs, ys, accums, out=None, reference: str = "float") -> dict:
+    """Print the error summary to ``out`` (stdout) and return it."""
+    errors = compute_errors(xs, ys, accums, reference)
+    (out or sys.stdout).writelines(_format_summary(errors))
+    return errors
+
+
+# ------------------------------------------------------------
+# Streaming validation
+# ------------------------------------------------------------
+
+_STATE_FIELDS = ("x", "y", "rx", "ry", "accum", "step")
+
+
+def _validate_chunk(task):
+    """Validate one chunk; returns the validator and the engine state after it."""
+    theta, start, count, fft_size, use_table, lock, state = task
+    rot = make_rotation(theta)
+    if state is None:
+        state = seek(rot, start, lock)
+    else:
+        state = OscillatorState(*state)
+    validator = StreamValidator(fft_size)
+    table = table_reference(reference_table(theta, count, start)) if use_table else None
+    validator.update(*generate(state, rot, count, lock), table)
+    return validator, [getattr(state, f) for f in _STATE_FIELDS]
+
+
+def _save_checkpoint(path: str, meta: dict, state, validator: StreamValidator):
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)),
+                               suffix=".json.tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump({**meta, "state": state, "validator": validator.to_dict()}, f)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def validate_stream(n_steps: int, theta: int = None, chunk: int = 1 << 16,
+                    fft_size: int = FFT_SIZE, checkpoint: str = None,
+                    checkpoint_every: int = 64, workers: int = 1, out=None,
+                    reference: str = "float", lock: int = None) -> dict:
+    """
+    Validate ``n_steps`` samples from (1, 0) in chunks of ``chunk`` samples.
+
+    Memory stays bounded by a few chunks.  Chunks run in order, each
+    continuing from the exact engine state the previous one ended in, so
+    the samples are those of one serial ``generate``.  With ``checkpoint``
+    the statistics and that engine state are written there every
+    ``checkpoint_every`` chunks and at the end, and a matching checkpoint
+    found there is resumed.
+
+    ``lock`` validates the locked oscillator (``generate(..., lock=lock)``)
+    instead; only then can ``workers`` > 1 (or None for all cores)
+    validate chunks in a process pool, each starting from ``engine.seek``.
+    A progress line per checkpoint goes to ``out`` when given.
+    ``reference="table"`` compares each chunk against its own rows of the
+    reference table (sliced from REFERENCE_CACHE, or built per chunk
+    without a cache) instead of float64.  Returns the summary.
+    """
+    if chunk % fft_size:
+        raise ValueError("chunk must be a multiple of fft_size")
+    if workers != 1 and not lock:
+        raise ValueError("parallel validation needs lock: without it every "
+                         "chunk depends on all earlier steps")
+    if theta is None:
+        theta = default_theta(max(n_steps, 8))
+    meta = {"theta": theta, "n_steps": n_steps, "chunk": chunk, "fft_size": fft_size,
+            "reference": reference, "lock": lock}
+
+    validator = StreamValidator(fft_size)
+    state = [getattr(OscillatorState(), f) for f in _STATE_FIELDS]
+    if checkpoint and os.path.exists(checkpoint):
+        with open(checkpoint) as f:
+            saved = json.load(f)
+        if any(saved.get(k) != v for k, v in meta.items()):
+            raise ValueError(f"{checkpoint} belongs to a different run")
+        validator, state = StreamValidator.from_dict(saved["validator"]), saved["state"]
+
+    use_table = reference == "table"
+    pool = ProcessPoolExecutor(workers) if workers != 1 else None
+    try:
+        step = state[-1]
+        while step < n_steps:
+            stop = min(n_steps, step + checkpoint_every * chunk)
+            starts = range(step, stop, chunk)
+            if pool:
+                tasks = [(theta, s, min(chunk, stop - s), fft_size, use_table, lock, None)
+                         for s in starts]
+                for part, state in pool.map(_validate_chunk, tasks):
+                    validator.merge(part)
+            else:
+                for s in starts:
+                    part, state = _validate_chunk(
+                        (theta, s, min(chunk, stop - s), fft_size, use_table, lock, state))
+                    validator.merge(part)
+            step = stop
+            if checkpoint:
+                _save_checkpoint(checkpoint, meta, state, validator)
+            if out is not None:
+                summary = validator.summary()
+                out.write(f"{step}/{n_steps} steps, max |err| "
+                          f"{max(summary['max_err_x'], summary['max_err_y']):.3e}, "
+                          f"drift {summary['final_phase_drift']:.3e}\n")
+    finally:
+        if pool:
+            pool.shutdown()
+    return validator.summary()
+
+
+if __name__ == "__main__":
+    steps = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000_000
+    # by default next to the cached tables, never in the working directory
+    path = sys.argv[2] if len(sys.argv) > 2 else os.path.join(
+        REFERENCE_CACHE or tempfile.gettempdir(), "validation_checkpoint.json")
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    summary = validate_stream(steps, checkpoint=path, out=sys.stdout)
+    sys.stdout.writelines(_format_summary(summary))
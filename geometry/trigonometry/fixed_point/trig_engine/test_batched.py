@@ -0,0 +1,32 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# Copyright (c) 2025 Artur Flamandzki
+
+"""The batched oscillator is bit-identical to the scalar one, channel by channel."""
+
+import numpy as np
+import pytest
+
+from trig_engine.batched import run_batched_engine
+from trig_engine.engine import PI, OscillatorState, default_theta, generate, make_rotation
+
+THETAS = [default_theta(1028), default_theta(8), -default_theta(100), PI // 4,
+          -(PI // 4), 1, 0, 123456789012345]
+
+
+@pytest.mark.parametrize("lock", [None, 64])
+def test_batched_matches_scalar(lock):
+    n = 700
+    result = run_batched_engine(THETAS, n, lock=lock)
+    for k, theta in enumerate(THETAS):
+        xs, ys, accums = generate(OscillatorState(), make_rotation(theta), n, lock)
+        assert result["xs"][k].tolist() == xs
+        assert result["ys"][k].tolist() == ys
+        assert result["accums"][k].tolist() == [a % (2 * PI) for a in accums]
+
+
+def test_batched_shapes():
+    result = run_batched_engine(THETAS[:3], 5)
+    for name in ("xs", "ys", "accums"):
+        assert result[name].shape == (3, 5)
+        assert result[name].dtype == np.int64
+    assert [r.theta for r in result["rotations"]] == THETAS[:3]
@@ -0,0 +1,88 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# Copyright (c) 2025 Artur Flamandzki
+
+"""Benchmark rows, their error column, and the JSON / CSV writers."""
+
+import csv
+import json
+import math
+
+import pytest
+
+from trig_engine import diagnostics
+from trig_engine.benchmark import (
+    LUT_SIZE, METHODS, ROW_FIELDS, TWO_PI, bench_theta, benchmark, cordic, main,
+    write_rows,
+)
+from trig_engine.engine import ONE, PI
+
+SIZES = [128, 2048]
+
+
+@pytest.fixture(scope="module")
+def rows():
+    return benchmark(SIZES, trials=2, warmup=0)
+
+
+def test_row_schema(rows):
+    assert [(r["method"], r["n"]) for r in rows] == [(m, n) for n in SIZES for m in METHODS]
+    for row in rows:
+        assert tuple(row) == ROW_FIELDS
+        assert row["trials"] == 2
+        assert 0 < row["min_ns_per_sample"] <= row["ns_per_sample"]
+        assert row["samples_per_sec"] == pytest.approx(1e9 / row["ns_per_sample"])
+
+
+def test_row_errors(rows):
+    for row in rows:
+        if row["method"] == "lut_interp":
+            # linear interpolation: (2·pi / 4096)² / 8, reached off the nodes
+            bound = (2 * math.pi / LUT_SIZE) ** 2 / 8
+            assert bound / 10 < row["max_error"] <= bound * 1.01
+        else:
+            assert row["max_error"] < 1e-15
+
+
+def test_references_come_from_the_cache(rows, monkeypatch):
+    def no_building(*args):
+        raise AssertionError("reference table built again")
+
+    monkeypatch.setattr(diagnostics, "_fill_table", no_building)
+    again = benchmark(SIZES, trials=1, warmup=0, methods=["numpy"])
+    assert [r["max_error"] for r in again] == [r["max_error"] for r in rows
+                                               if r["method"] == "numpy"]
+
+
+def test_phases_miss_the_lut_nodes():
+    for n in (128, 256, 512, 1024, 4096):
+        theta = bench_theta(n)
+        nodes = {(k * theta % TWO_PI) * LUT_SIZE % TWO_PI == 0 for k in range(1, n)}
+        assert nodes == {False}
+
+
+def test_cordic_covers_the_circle():
+    for phase in (-PI, -PI // 2 - 1, -1, 0, 1, PI // 3, PI // 2 + 1, PI):
+        c, s = cordic(phase)
+        assert c / ONE == pytest.approx(math.cos(phase / ONE), abs=1e-15)
+        assert s / ONE == pytest.approx(math.sin(phase / ONE), abs=1e-15)
+
+
+def test_write_rows(tmp_path, rows):
+    json_path, csv_path = str(tmp_path / "rows.json"), str(tmp_path / "rows.csv")
+    write_rows(rows, json_path)
+    write_rows(rows, csv_path)
+    with open(json_path) as f:
+        assert json.load(f) == rows
+    with open(csv_path, newline="") as f:
+        table = list(csv.DictReader(f))
+    assert tuple(table[0]) == ROW_FIELDS
+    assert [(r["method"], int(r["n"])) for r in table] == [(r["method"], r["n"]) for r in rows]
+
+
+def test_main_writes_rows(tmp_path, capsys):
+    path = str(tmp_path / "rows.json")
+    main(["--sizes", "64", "--trials", "1", "--methods", "engine", "numpy",
+          "--output", path])
+    with open(path) as f:
+        assert [r["method"] for r in json.load(f)] == ["engine", "numpy"]
+    assert len(capsys.readouterr().out.splitlines()) == 2
@@ -0,0 +1,190 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# Copyright (c) 2025 Artur Flamandzki
+
+"""
+Streaming validation against an in-memory run, merging and checkpoint
+resume; reference tables against exact evaluation, with and without a cache.
+"""
+
+import json
+import os
+
+import numpy as np
+import pytest
+
+from trig_engine import diagnostics
+from trig_engine.diagnostics import (
+    StreamValidator, compute_errors, default_cache_dir, reference_table,
+    validate_stream,
+)
+from trig_engine.engine import (
+    PI, Q, OscillatorState, default_theta, generate, make_rotation, sin_cos_at,
+)
+
+N, CHUNK, FFT = 5000, 1024, 256
+THETA = default_theta(N)
+
+
+class Interrupted(Exception):
+    pass
+
+
+class _StopAfter:
+    """``out`` that interrupts the run after ``lines`` progress lines."""
+
+    def __init__(self, lines):
+        self.lines = lines
+
+    def write(self, text):
+        self.lines -= 1
+        if self.lines == 0:
+            raise Interrupted
+
+
+def _in_memory(n=N, lock=None):
+    validator = StreamValidator(FFT)
+    validator.update(*generate(OscillatorState(), make_rotation(THETA), n, lock))
+    return validator.summary()
+
+
+def _assert_same(summary, expected):
+    assert summary.keys() == expected.keys()
+    for key, value in expected.items():
+        assert summary[key] == pytest.approx(value, rel=1e-9, abs=1e-30), key
+
+
+def test_stream_matches_in_memory():
+    summary = validate_stream(N, THETA, chunk=CHUNK, fft_size=FFT, checkpoint_every=2)
+    assert summary["samples"] == N
+    _assert_same(summary, _in_memory())
+
+
+def test_merge_of_consecutive_ranges():
+    xs, ys, accums = generate(OscillatorState(), make_rotation(THETA), N)
+    whole, first, second = (StreamValidator(FFT) for _ in range(3))
+    whole.update(xs, ys, accums)
+    first.update(xs[:2 * FFT], ys[:2 * FFT], accums[:2 * FFT])
+    second.update(xs[2 * FFT:], ys[2 * FFT:], accums[2 * FFT:])
+    first.merge(second)
+    _assert_same(first.summary(), whole.summary())
+
+
+def test_merge_needs_whole_blocks():
+    first = StreamValidator(FFT)
+    first.update(*generate(OscillatorState(), make_rotation(THETA), FFT + 1))
+    with pytest.raises(ValueError):
+        first.merge(StreamValidator(FFT))
+
+
+def test_validator_round_trips_through_json():
+    validator = StreamValidator(FFT)
+    validator.update(*generate(OscillatorState(), make_rotation(THETA), 1000))
+    restored = StreamValidator.from_dict(json.loads(json.dumps(validator.to_dict())))
+    assert restored.summary() == validator.summary()
+    assert list(restored.pending) == list(validator.pending)
+
+
+def test_checkpoint_resume(tmp_path):
+    path = str(tmp_path / "run.json")
+    args = dict(theta=THETA, chunk=CHUNK, fft_size=FFT, checkpoint=path,
+                checkpoint_every=1)
+    with pytest.raises(Interrupted):
+        validate_stream(N, out=_StopAfter(2), **args)
+    with open(path) as f:
+        assert json.load(f)["state"][-1] == 2 * CHUNK
+    _assert_same(validate_stream(N, **args), _in_memory())
+
+
+def test_checkpoint_of_another_run_is_rejected(tmp_path):
+    path = str(tmp_path / "run.json")
+    validate_stream(2 * CHUNK, THETA, chunk=CHUNK, fft_size=FFT, checkpoint=path)
+    with pytest.raises(ValueError):
+        validate_stream(N, THETA, chunk=CHUNK, fft_size=FFT, checkpoint=path)
+
+
+def test_parallel_needs_lock():
+    with pytest.raises(ValueError):
+        validate_stream(N, THETA, chunk=CHUNK, fft_size=FFT, workers=2)
+
+
+def test_parallel_locked_matches_serial():
+    args = dict(theta=THETA, chunk=CHUNK, fft_size=FFT, lock=512)
+    parallel = validate_stream(N, workers=2, **args)
+    _assert_same(parallel, validate_stream(N, **args))
+    _assert_same(parallel, _in_memory(lock=512))
+
+
+# ------------------------------------------------------------
+# Reference tables
+# ------------------------------------------------------------
+
+@pytest.fixture
+def no_cache(monkeypatch):
+    monkeypatch.setattr(diagnostics, "REFERENCE_CACHE", None)
+
+
+def _rows(table, bits):
+    shift = bits - Q
+    return [((int(r["sin_hi"]) << shift) + int(r["sin_lo"]),
+             (int(r["cos_hi"]) << shift) + int(r["cos_lo"])) for r in table]
+
+
+@pytest.mark.parametrize("theta", [THETA, -default_theta(37), PI // 4])
+@pytest.mark.parametrize("bits", [100, 120, 123])
+def test_table_matches_exact_evaluation(theta, bits, no_cache):
+    start, count = 123, 9000     # crosses two anchors
+    rows = _rows(reference_table(theta, count, start, bits), bits)
+    for k in range(0, count, 7):
+        S, C = sin_cos_at(theta, start + k, bits)
+        assert abs(rows[k][0] - S) <= 1 and abs(rows[k][1] - C) <= 1
+
+
+def test_table_matches_mpmath(no_cache):
+    mpmath = pytest.importorskip("mpmath")
+    mpmath.mp.prec = 200
+    rows = _rows(reference_table(THETA, 50, 10_000), 120)
+    for k in (0, 17, 49):
+        angle = mpmath.mpf(THETA * (10_000 + k)) / 2 ** Q
+        assert abs(rows[k][0] - int(mpmath.nint(mpmath.sin(angle) * 2 ** 120))) <= 2
+        assert abs(rows[k][1] - int(mpmath.nint(mpmath.cos(angle) * 2 ** 120))) <= 2
+
+
+def test_table_without_cache_writes_nothing(tmp_path, monkeypatch, no_cache):
+    monkeypatch.chdir(tmp_path)
+    table = reference_table(THETA, 100)
+    assert not isinstance(table, np.memmap)
+    assert os.listdir(tmp_path) == []
+
+
+def test_cached_table_is_reused(tmp_path, no_cache):
+    expected = reference_table(THETA, 5000, 100)
+    cached = reference_table(THETA, 5000, 100, cache_dir=str(tmp_path))
+    assert os.listdir(tmp_path) == [f"ref_{THETA}_120_100_5100.npy"]
+    inner = reference_table(THETA, 1000, 2000, cache_dir=str(tmp_path))
+    assert len(os.listdir(tmp_path)) == 1
+    assert isinstance(inner, np.memmap)
+    assert np.array_equal(cached, expected)
+    assert np.array_equal(inner, expected[1900:2900])
+
+
+def test_default_cache_dir(tmp_path):
+    assert default_cache_dir({"TRIG_ENGINE_CACHE": str(tmp_path)}) == str(tmp_path)
+    assert default_cache_dir({"TRIG_ENGINE_CACHE": "", "XDG_CACHE_HOME": "x"}) is None
+    assert default_cache_dir({"XDG_CACHE_HOME": str(tmp_path)}) == str(tmp_path / "trig_engine")
+    assert default_cache_dir({}).endswith(os.path.join(".cache", "trig_engine"))
+
+
+def test_table_bits_out_of_range(no_cache):
+    for bits in (60, 124):
+        with pytest.raises(ValueError):
+            reference_table(THETA, 10, bits=bits)
+
+
+def test_table_and_float_references_agree(no_cache):
+    xs, ys, accums = generate(OscillatorState(), make_rotation(THETA), 3000)
+    table = compute_errors(xs, ys, accums, reference="table")
+    floats = compute_errors(xs, ys, accums)
+    assert table["max_err_x"] == pytest.approx(floats["max_err_x"], abs=1e-15)
+    assert table["max_amplitude_err"] == floats["max_amplitude_err"]
+    stream = validate_stream(N, THETA, chunk=CHUNK, fft_size=FFT, reference="table")
+    assert stream["max_err_y"] == pytest.approx(_in_memory()["max_err_y"], abs=1e-15)
@@ -0,0 +1,85 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# Copyright (c) 2025 Artur Flamandzki
+
+"""
+The amplitude bound, jump against k × advance, and seek / generate_parallel
+against a serial run.
+"""
+
+from dataclasses import astuple
+
+import pytest
+
+from trig_engine.engine import (
+    ONE, PI, OscillatorState, advance, default_theta, generate, generate_parallel,
+    jump, make_rotation, seek,
+)
+
+ROT = make_rotation(default_theta(1028))
+
+
+def _serial(state, rot, k, lock=None):
+    for _ in range(k):
+        advance(state, rot, lock)
+    return state
+
+
+def test_generate_is_the_advance_recurrence():
+    xs, ys, accums = generate(OscillatorState(), ROT, 300)
+    state = OscillatorState()
+    for x, y, accum in zip(xs, ys, accums):
+        assert (state.x, state.y, state.accum) == (x, y, accum)
+        advance(state, ROT)
+
+
+@pytest.mark.parametrize("theta", [default_theta(1028), -default_theta(37), PI // 4])
+def test_amplitude_error_grows_at_most_linearly(theta):
+    rot = make_rotation(theta)
+    assert abs(rot.c ** 2 + rot.s ** 2 - ONE * ONE) <= ONE
+    xs, ys, _ = generate(OscillatorState(), rot, 10000)
+    for k in (100, 1000, 9999):
+        error = abs(xs[k] ** 2 + ys[k] ** 2 - ONE * ONE) / ONE ** 2
+        assert error <= (k + 2) * 2.0 ** -60
+
+
+def test_jump_zero_is_exact():
+    state = _serial(OscillatorState(), ROT, 77)
+    assert astuple(jump(OscillatorState(*astuple(state)), 0, ROT)) == astuple(state)
+
+
+@pytest.mark.parametrize("theta", [default_theta(1028), -default_theta(37), PI // 4, 1 << 50])
+@pytest.mark.parametrize("k", [1, 2, 1000, 20000])
+def test_jump_matches_serial(theta, k):
+    rot = make_rotation(theta)
+    start = _serial(OscillatorState(), rot, 13)     # any state, not just (1, 0)
+    expected = _serial(OscillatorState(*astuple(start)), rot, k)
+    jumped = jump(OscillatorState(*astuple(start)), k, rot)
+    assert (jumped.accum, jumped.step) == (expected.accum, expected.step)
+    bound = 1 + k * abs(theta) // (2 * ONE)
+    assert abs(jumped.x - expected.x) <= bound
+    assert abs(jumped.y - expected.y) <= bound
+
+
+def test_jump_small_angle_long_run():
+    expected = OscillatorState()
+    generate(expected, ROT, 100000)
+    jumped = jump(OscillatorState(), 100000, ROT)
+    assert abs(jumped.x - expected.x) <= 2
+    assert abs(jumped.y - expected.y) <= 2
+
+
+def test_jump_rejects_negative_steps():
+    with pytest.raises(ValueError):
+        jump(OscillatorState(), -1, ROT)
+
+
+@pytest.mark.parametrize("step", [0, 1, 63, 64, 65, 1000])
+def test_seek_matches_locked_serial(step):
+    expected = _serial(OscillatorState(), ROT, step, lock=64)
+    assert astuple(seek(ROT, step, lock=64)) == astuple(expected)
+
+
+def test_generate_parallel_matches_locked_serial():
+    serial = generate(OscillatorState(), ROT, 3000, lock=64)
+    parallel = generate_parallel(ROT, 2500, start=500, workers=2, chunk=700, lock=64)
+    assert parallel == tuple(column[500:] for column in serial)
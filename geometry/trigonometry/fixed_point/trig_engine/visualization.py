@@ -0,0 +1,97 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# Copyright (c) 2025 Artur Flamandzki
+
+"""
+Plots of an oscillator run and of benchmark rows.
+
+Matplotlib is imported only when something is drawn; without a display
+the headless Agg backend is used and figures go to ``outfile``.
+"""
+
+import math
+import os
+import sys
+
+from trig_engine.engine import ONE
+
+REPO = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__))))))
+sys.path.insert(0, REPO)
+from relmath.display import has_display
+
+
+def _pyplot():
+    import matplotlib
+    if not has_display():
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def _finish(plt, fig, outfile):
+    if outfile:
+        fig.savefig(outfile, dpi=120)
+        plt.close(fig)
+    elif has_display():
+        plt.show()
+    else:
+        plt.close(fig)
+
+
+def plot_with_accum_ref(xs, ys, accums, outfile=None):
+    """
+    Engine samples against cos / sin of the phase accumulator (top) and
+    the difference between them (bottom).
+    """
+    plt = _pyplot()
+    steps = range(len(xs))
+    fx = [x / ONE for x in xs]
+    fy = [y / ONE for y in ys]
+    ref_x = [math.cos(a / ONE) for a in accums]
+    ref_y = [math.sin(a / ONE) for a in accums]
+
+    fig, (top, bottom) = plt.subplots(2, 1, sharex=True, figsize=(9, 6))
+    top.plot(steps, fx, label="x (engine)")
+    top.plot(steps, fy, label="y (engine)")
+    top.plot(steps, ref_x, "k:", linewidth=0.8, label="cos(accum)")
+    top.plot(steps, ref_y, "k--", linewidth=0.8, label="sin(accum)")
+    top.set_ylabel("value")
+    top.legend(loc="upper right")
+
+    bottom.plot(steps, [a - b for a, b in zip(fx, ref_x)], label="x - cos")
+    bottom.plot(steps, [a - b for a, b in zip(fy, ref_y)], label="y - sin")
+    bottom.set_xlabel("step")
+    bottom.set_ylabel("error")
+    bottom.legend(loc="upper right")
+
+    fig.suptitle("Q1.60 small-angle oscillator vs phase accumulator")
+    fig.tight_layout()
+    _finish(plt, fig, outfile)
+
+
+def plot_benchmark(rows, outfile=None):
+    """
+    ns/sample (left) and max error (right) against run length, one line
+    per benchmarked method.
+    """
+    plt = _pyplot()
+    methods = {}
+    for row in rows:
+        methods.setdefault(row["method"], []).append(
+            (row["n"], row["ns_per_sample"], row["max_error"]))
+
+    fig, (speed, error) = plt.subplots(1, 2, figsize=(12, 5))
+    for method, points in methods.items():
+        points.sort()
+        sizes = [n for n, _, _ in points]
+        speed.plot(sizes, [t for _, t, _ in points], "o-", label=method)
+        error.plot(sizes, [max(e, 1e-20) for _, _, e in points], "o-", label=method)
+    for ax, label in ((speed, "ns / sample"), (error, "max error")):
+        ax.set_xscale("log")
+        ax.set_yscale("log")
+        ax.set_xlabel("samples per run")
+        ax.set_ylabel(label)
+        ax.legend()
+    fig.suptitle("Benchmark")
+    fig.tight_layout()
+    _finish(plt, fig, outfile)
@@ -1,20 +1,25 @@
-import matplotlib.pyplot as plt
-from matplotlib.widgets import Button
-from matplotlib import animation
-from matplotlib.animation import FFMpegWriter, PillowWriter
+# Matplotlib (and NumPy) are imported only when something is drawn, so
+# importing this module for prepare_states / iter_states stays cheap and
+# never opens a GUI backend.
 import os
+import sys
 
-from matplotlib.animation import FFMpegWriter
-print(FFMpegWriter)
+from cycle_engine import CycleStates, iter_states
 
+REPO = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, REPO)
+from relmath.display import has_display
 
 
 EXPORT_DIR = "exported_data"
-os.makedirs(EXPORT_DIR, exist_ok=True)
 
 # Parameters
 bar_width = 0.8
 colors = {1: 'red', 0: 'green'}
+# Horizontal pixels per cycle column; bar_width of them are painted
+column_px = 10
+# Upper bound on labelled x ticks; labels are thinned beyond that
+max_ticks = 40
 
 # Global state
 cycles = []
@@ -22,55 +27,109 @@ discovered = []
 states = []
 n = 2
 
-fig, ax = plt.subplots()
-plt.subplots_adjust(bottom=0.25)
+# Created by setup_figure on first use
+plt = None
+fig, ax = None, None
 
 current_index = [0]
 auto_play = [False]
+image = [None]
 
-def prepare_states(max_n):
-    global cycles, discovered, states, n
-    cycles = []
-    discovered = []
-    states = []
-    n = 2
 
-    while n <= max_n:
-        # Rotate all existing cycles
-        for i in range(len(cycles)):
-            cycles[i] = cycles[i][1:] + [cycles[i][0]]
+def setup_figure(interactive=False):
+    """
+    Import pyplot and create the figure on first use.
 
-        # Check elimination
-        is_eliminated = any(c[0] == 1 for c in cycles)
+    File exports, and any session without a display, use the headless Agg
+    backend; only the interactive viewer keeps matplotlib's default one.
+    """
+    global plt, fig, ax
+    if fig is None:
+        import matplotlib
+        if not (interactive and has_display()):
+            matplotlib.use("Agg")
+        import matplotlib.pyplot as pyplot
+        plt = pyplot
+        fig, ax = plt.subplots()
+        plt.subplots_adjust(bottom=0.25)
+    return fig, ax
 
-        # Add new cycle if not eliminated
-        if not is_eliminated:
-            new_cycle = [1] + [0] * (n - 1)
-            cycles.append(new_cycle.copy())
-            discovered.append(n)
 
-        # Save snapshot state
-        states.append((n, [c.copy() for c in cycles], discovered.copy()))
-        n += 1
+def prepare_states(max_n):
+    # Cycles are kept as (modulus, phase) by the engine; states[i] rebuilds
+    # the (n, cycles, discovered) snapshot for n = i + 2 only when drawn
+    global cycles, discovered, states, n
+    states = CycleStates(max_n)
+    discovered = states.discovered
+    cycles = states.phases(-1) if len(states) else []
+    n = max(max_n, 1) + 1
+
+
+def cycle_grid(n_val, moduli):
+    """
+    Rasterize the cycles of step n_val into a uint8 RGB array.
+
+    Column i is cycle moduli[i]; row j is position j, red where the cycle
+    holds its 1 ((-n_val) % m), green elsewhere up to its length, white
+    above it and in the gaps between bars.  Pixels are built as one-byte
+    palette indices and looked up once, so a frame takes 3 bytes a pixel.
+    """
+    import numpy as np
+    from matplotlib.colors import to_rgb
+
+    mods = np.asarray(moduli)
+    rows = np.arange(int(mods.max()))[:, None]
+    # 0 white, 1 cycle body, 2 the cycle's 1
+    index = (rows < mods).view(np.uint8) + (rows == (-n_val) % mods)
+
+    index = np.repeat(index, column_px, axis=1)
+    gap = int(round(column_px * (1 - bar_width) / 2))
+    px = np.arange(index.shape[1]) % column_px
+    index[:, (px < gap) | (px >= column_px - gap)] = 0
+
+    palette = np.array([to_rgb("white"), to_rgb(colors[0]), to_rgb(colors[1])])
+    return np.rint(palette * 255).astype(np.uint8)[index]
+
+
+def draw_frame(n_val, moduli, redraw=True):
+    """Update the persistent image artist to show step n_val."""
+    setup_figure()
+    grid = cycle_grid(n_val, moduli)
+    height = grid.shape[0]
+    extent = (-0.5, len(moduli) - 0.5, 0, height)
+
+    if image[0] is None:
+        ax.clear()
+        ax.set_xlabel("Cycle (number)")
+        ax.set_ylabel("Positions")
+        image[0] = ax.imshow(grid, origin='lower', aspect='auto',
+                             interpolation='nearest', extent=extent)
+    else:
+        image[0].set_data(grid)
+        image[0].set_extent(extent)
 
+    ax.set_ylim(0, height + 1)
+    ax.set_xlim(-0.5, len(moduli) - 0.5)
+    ax.set_title(f"Elimination cycles: n = {n_val}")
+    stride = -(-len(moduli) // max_ticks)
+    ax.set_xticks(range(0, len(moduli), stride))
+    ax.set_xticklabels(moduli[::stride])
 
-def draw_state(index):
-    ax.clear()
-    n_val, cycles_snapshot, discovered_snapshot = states[index]
+    if redraw:
+        fig.canvas.draw_idle()
 
-    ax.set_ylim(0, max(len(c) for c in cycles_snapshot) + 1)
-    ax.set_xlim(-0.5, len(cycles_snapshot) - 0.5)
-    ax.set_title(f"Elimination cycles: n = {n_val}")
-    ax.set_xlabel("Cycle (number)")
-    ax.set_ylabel("Positions")
-    ax.set_xticks(range(len(cycles_snapshot)))
-    ax.set_xticklabels(discovered_snapshot)
 
-    for i, cycle in enumerate(cycles_snapshot):
-        for j, bit in enumerate(cycle):
-            ax.bar(i, 1, bottom=j, color=colors[bit], width=bar_width)
+def draw_state(index):
+    draw_frame(*states.moduli(index))
 
-    fig.canvas.draw_idle()
+
+def stream_frames(max_n, writer, outfile):
+    """Simulate and hand every frame straight to the writer."""
+    setup_figure()
+    with writer.saving(fig, outfile, dpi=fig.dpi):
+        for n_val, moduli in iter_states(max_n):
+            draw_frame(n_val, moduli, redraw=False)
+            writer.grab_frame()
 
 
 def forward(event=None):
@@ -113,8 +172,6 @@ def run_interface():
     except ValueError:
         fps = 2
 
-    prepare_states(max_n)
-
     print("\nWhat do you want to do?")
     print("1 - Save animation as GIF")
     print("2 - Save animation as MP4")
@@ -128,36 +185,35 @@ def run_interface():
     os.makedirs("exported_data", exist_ok=True)
 
     if choice == '1':
+        from matplotlib.animation import PillowWriter
         outfile = os.path.join("exported_data", "cycles_animation.gif")
         writer = PillowWriter(fps=fps)
-        ani = animation.FuncAnimation(fig, lambda f: draw_state(f),
-                                    frames=len(states), blit=False)
-        ani.save(outfile, writer=writer)
+        stream_frames(max_n, writer, outfile)
         print(f"✅ Saved: {outfile}")
 
     elif choice == '2':
         outfile = os.path.join("exported_data", "cycles_animation.mp4")
         try:
+            from matplotlib.animation import FFMpegWriter
             writer = FFMpegWriter(fps=fps)
         except Exception as e:
             print("❌ FFMpegWriter not available. Is ffmpeg installed and in PATH?")
             print(e)
             return
 
-        ani = animation.FuncAnimation(fig, lambda f: draw_state(f),
-                                    frames=len(states), blit=False)
-        ani.save(outfile, writer=writer)
+        stream_frames(max_n, writer, outfile)
         print(f"✅ Saved: {outfile}")
 
     elif choice == '3':
         # Save each frame as EPS
-        for idx in range(len(states)):
-            draw_state(idx)
+        for idx, (n_val, moduli) in enumerate(iter_states(max_n)):
+            draw_frame(n_val, moduli, redraw=False)
             outfile = os.path.join(EXPORT_DIR, f"frame_{idx:03d}.eps")
             fig.savefig(outfile, format='eps')
         print(f"✅ Saved EPS frames to folder: {EXPORT_DIR}")
 
     elif choice == '4':
+        prepare_states(max_n)
         try:
             frame = int(input(f"Frame index 0..{len(states)-1}: "))
             if 0 <= frame < len(states):
@@ -171,6 +227,8 @@ def run_interface():
             print("Invalid number.")
 
     else:
+        from matplotlib.widgets import Button
+        setup_figure(interactive=True)
         axprev = plt.axes([0.1, 0.05, 0.15, 0.075])
         axnext = plt.axes([0.3, 0.05, 0.15, 0.075])
         axauto = plt.axes([0.55, 0.05, 0.15, 0.075])
@@ -184,6 +242,7 @@ def run_interface():
         bauto = Button(axauto, '⏯️ Auto')
         bauto.on_clicked(toggle_auto)
 
+        prepare_states(max_n)
         draw_state(0)
         plt.show()
 
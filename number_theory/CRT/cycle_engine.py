@@ -0,0 +1,102 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# Copyright (c) 2025 Artur Flamandzki
+
+"""
+Phase-counter engine for the congruence cycle simulator.
+
+A cycle born at step m is ``[1] + [0] * (m - 1)`` and is rotated left by
+one on every later step, so at step n its front is 1 exactly when
+n % m == 0, and the 1 sits at position (-n) % m.  Each cycle is therefore
+fully described by its modulus m and the phase n % m — no list needs to
+be rotated.
+
+Elimination at step n means some existing cycle shows 1 at its front.
+Instead of checking every cycle, each modulus is filed under the next
+step at which its front returns to 1 (an incremental sieve), so a step
+costs only the cycles that actually hit it.
+
+The only history kept is the list of discovered moduli (a new cycle
+appears at n exactly when n is discovered); any frame is rebuilt from it
+on demand.
+"""
+
+from bisect import bisect_right
+
+
+def iter_states(max_n):
+    """
+    Yield ``(n, discovered)`` for n = 2..max_n while simulating.
+
+    ``discovered`` is the live list of cycle moduli after step n; copy it
+    if it has to outlive the next step.
+    """
+    discovered = []
+    fronts = {}   # step -> moduli whose front is 1 at that step
+
+    for n in range(2, max_n + 1):
+        hits = fronts.pop(n, None)
+        if hits is None:
+            discovered.append(n)
+            fronts[2 * n] = [n]
+        else:
+            for m in hits:
+                fronts.setdefault(n + m, []).append(m)
+        yield n, discovered
+
+
+def discover_cycles(max_n):
+    """Return the steps 2..max_n at which a new cycle is added."""
+    discovered = []
+    for _, discovered in iter_states(max_n):
+        pass
+    return discovered
+
+
+def cycle_at(m, n):
+    """Materialize the cycle of modulus m as it looks at step n."""
+    cycle = [0] * m
+    cycle[-n % m] = 1
+    return cycle
+
+
+class CycleStates:
+    """
+    Lazy sequence of simulator states for n = 2..max_n.
+
+    ``states[i]`` is the same ``(n, cycles, discovered)`` tuple that the
+    list built by ``prepare_states`` used to hold for n = i + 2, but it is
+    built only when accessed.
+    """
+
+    def __init__(self, max_n):
+        self.max_n = max_n
+        self.discovered = discover_cycles(max_n)
+
+    def __len__(self):
+        return max(self.max_n - 1, 0)
+
+    def _n(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("state index out of range")
+        return index + 2
+
+    def phases(self, index):
+        """``[(modulus, phase), ...]`` of all cycles in state ``index``."""
+        n = self._n(index)
+        return [(m, n % m) for m in self.discovered[:bisect_right(self.discovered, n)]]
+
+    def moduli(self, index):
+        """``(n, discovered)`` of state ``index`` without building cycles."""
+        n = self._n(index)
+        return n, self.discovered[:bisect_right(self.discovered, n)]
+
+    def __getitem__(self, index):
+        n = self._n(index)
+        moduli = self.discovered[:bisect_right(self.discovered, n)]
+        return (n, [cycle_at(m, n) for m in moduli], list(moduli))
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
@@ -1,120 +1,219 @@
 # SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
 # Copyright (c) 2025 Artur Flamandzki
 
-from sympy import isprime, primerange, nextprime
+import numpy as np
 
-def goldbach_constructive_incremental(N):
-    """
-    Konstrukcyjny algorytm Goldbacha (wersja inkrementalna).
-    Wykorzystuje przyrostową aktualizację listy liczb pierwszych.
-    Zwraca (N, p, q, P) gdzie N = p + q i p, q ≤ P.
-    """
-    if N % 2 != 0 or N < 4:
-        raise ValueError("N musi być parzyste i >= 4")
-
-    # startujemy od czubka >= N/2
-    P = nextprime(N // 2 - 1)
-    primes = list(primerange(2, P + 1))  # początkowa baza pierwszych
-
-    while True:
-        # budujemy parzyste różnice od czubka
-        E = sorted([P - p for p in primes if (P - p) % 2 == 0])
-        t = 2 * P - N  # offset
+import primality
+from primality import prime_table
 
-        # test dziury szczytowej
-        if t == 2 and not isprime(P - 2):
-            P = nextprime(P)
-            if P > primes[-1]:
-                primes.append(P)
-            continue
-
-        # najmniejsze dodatnie e1, e2
-        e_nonzero = [e for e in E if e > 0]
-        e1, e2 = (e_nonzero + [0, 0])[:2]
-
-        # przypadek 1: domknięcie ogona
-        if t >= e1 + e2:
-            for p in primes:
-                q = N - p
-                if q <= P and isprime(q):
-                    return (N, p, q, P)
 
-        # przypadek 2: t w E
-        if t in E:
-            for p in primes:
-                q = N - p
-                if q <= P and isprime(q):
-                    return (N, p, q, P)
+def _to_bitset(flags):
+    """Tablica bool -> int Pythona z bitem i ustawionym dla flags[i]."""
+    packed = np.packbits(flags, bitorder="little")
+    return int.from_bytes(packed.tobytes(), "little")
 
-        # przypadek 3: t w E+E
-        Eset = set(E)
-        for ei in E:
-            if (t - ei) in Eset:
-                for p in primes:
-                    q = N - p
-                    if q <= P and isprime(q):
-                        return (N, p, q, P)
 
-        # zwiększamy czubek przyrostowo
-        P = nextprime(P)
-        if P > primes[-1]:
-            primes.append(P)
+class _PeakState:
+    """
+    Trwała struktura czubka P dla algorytmu konstrukcyjnego.
+
+    Liczby pierwsze trzymane są jako tablica bool (test "P - e jest pierwsze"
+    to jedno odczytanie), a zbiór różnic E = {P - p : p nieparzyste, p <= P}
+    jako bitset w int Pythona.  Przy przejściu P -> P' = nextprime(P)
+    E przesuwa się o P' - P i dostaje 0, a e1, e2 wynikają z dwóch
+    poprzednich nieparzystych liczb pierwszych, więc nic nie jest
+    przeliczane od zera.  Test t w E+E to jedno AND dwóch bitsetów.
+    """
 
-def goldbach_constructive_incremental_steps(N):
+    def __init__(self, N):
+        self.N = N
+        self.table = prime_table(N + 1)
+        self.P = self._next_prime(N // 2 - 1)
+
+        odd = self.table[:self.P + 1].copy()
+        odd[2:3] = False
+        # rev: bit p ustawiony dla nieparzystych pierwszych p <= P
+        self.rev = _to_bitset(odd)
+        # E: bit e ustawiony dla e = P - p, czyli rev odbity względem P
+        self.E = _to_bitset(odd[::-1])
+
+        # dwie największe nieparzyste liczby pierwsze < P (dla e1, e2)
+        self.prev = (np.flatnonzero(odd[:self.P])[::-1][:2]).tolist()
+
+    def _next_prime(self, n):
+        n += 1
+        while not self.table[n]:
+            n += 1
+        return n
+
+    def is_prime(self, n):
+        return bool(self.table[n])
+
+    @property
+    def e1_e2(self):
+        e = [self.P - p for p in self.prev] + [0, 0]
+        return e[0], e[1]
+
+    def t_in_E(self, t):
+        # t w E  <=>  P - t jest nieparzystą liczbą pierwszą <= P
+        return t % 2 == 0 and 0 <= t < self.P and self.is_prime(self.P - t)
+
+    def t_in_E_plus_E(self):
+        # t - e w E  <=>  bit (e + N - P) w rev
+        shift = self.N - self.P
+        other = self.rev >> shift if shift >= 0 else self.rev << -shift
+        return (self.E & other) != 0
+
+    def search(self):
+        """Najmniejsze p <= P z q = N - p pierwszym i q <= P."""
+        lo = max(2, self.N - self.P)
+        if lo > self.P:
+            return None
+        ps = np.arange(lo, self.P + 1)
+        hit = np.flatnonzero(self.table[lo:self.P + 1] & self.table[self.N - ps])
+        if not hit.size:
+            return None
+        p = lo + int(hit[0])
+        return p, self.N - p
+
+    def advance(self):
+        old = self.P
+        self.P = self._next_prime(old)
+        if old % 2:
+            self.E = (self.E << (self.P - old)) | 1
+            self.rev |= 1 << self.P
+            self.prev = [old] + self.prev[:1]
+        else:
+            # P = 2 -> 3: jedyne przejście przez parzysty czubek
+            self.E = 1
+            self.rev = 1 << self.P
+            self.prev = []
+
+
+class _SparsePeakState:
     """
-    Konstrukcyjny algorytm Goldbacha (wersja inkrementalna z liczeniem kroków).
-    Zwraca (N, p, q, P, steps), gdzie steps = ile razy zwiększano czubek P.
+    Czubek P dla N >= SIEVE_BOUND, bez tablicy do N: pierwszość przez
+    ``primality.is_prime`` (Miller–Rabin), kolejne P przez
+    ``primality.next_prime``.  Pamięć nie zależy od N.
+
+    E i rev nie są trzymane.  Pętla odwiedza P rosnąco od najmniejszej
+    liczby pierwszej >= N/2 i przy każdym P nie było rozkładu z q <= P
+    dla poprzednich czubków, więc jedynym nowym kandydatem jest q = P
+    (p = N - P jest wtedy najmniejsze).  Dla nieparzystego P test t w E+E
+    jest równoważny istnieniu rozkładu z p, q <= P (patrz goldbach_batch),
+    więc sprowadza się do tego samego sprawdzenia.
     """
+
+    def __init__(self, N):
+        self.N = N
+        self.P = primality.next_prime(N // 2 - 1)
+        # dwie największe nieparzyste liczby pierwsze < P (dla e1, e2)
+        self.prev = []
+        n = self.P - 2
+        while len(self.prev) < 2 and n > 2:
+            if primality.is_prime(n):
+                self.prev.append(n)
+            n -= 2
+
+    def is_prime(self, n):
+        return primality.is_prime(n)
+
+    @property
+    def e1_e2(self):
+        e = [self.P - p for p in self.prev] + [0, 0]
+        return e[0], e[1]
+
+    def t_in_E(self, t):
+        return t % 2 == 0 and 0 <= t < self.P and self.is_prime(self.P - t)
+
+    def t_in_E_plus_E(self):
+        return self.search() is not None
+
+    def search(self):
+        """q = P, jeśli N - P jest pierwsze (jedyny nowy kandydat)."""
+        p = self.N - self.P
+        if p < 2 or not self.is_prime(p):
+            return None
+        return p, self.P
+
+    def advance(self):
+        old = self.P
+        self.P = primality.next_prime(old)
+        self.prev = [old] + self.prev[:1]
+
+
+def _cross_check(result):
+    """Weryfikacja wyniku przez sympy (importowane dopiero tutaj)."""
+    from sympy import isprime, primerange
+
+    N, p, q, P, steps = result
+    # steps = liczba liczb pierwszych w [N/2, P); primerange zamiast
+    # primepi, bo primepi dla dużych N liczy od zera
+    ok = (p + q == N and q <= P and isprime(p) and isprime(q) and isprime(P)
+          and sum(1 for _ in primerange(N // 2, P)) == steps)
+    if not ok:
+        raise AssertionError(f"sympy nie potwierdza wyniku {result}")
+
+
+def _constructive(N, cross_check=False):
+    """Wspólny rdzeń obu wersji; zwraca (N, p, q, P, steps)."""
     if N % 2 != 0 or N < 4:
         raise ValueError("N musi być parzyste i >= 4")
-
-    P = nextprime(N // 2 - 1)
-    primes = list(primerange(2, P + 1))
+    if cross_check:
+        result = _constructive(N)
+        _cross_check(result)
+        return result
+
+    # tablica sita tylko poniżej SIEVE_BOUND, powyżej test pierwszości
+    if N + 1 < primality.SIEVE_BOUND:
+        state = _PeakState(N)
+    else:
+        state = _SparsePeakState(N)
     steps = 0
 
     while True:
-        E = sorted([P - p for p in primes if (P - p) % 2 == 0])
-        t = 2 * P - N
+        P = state.P
+        t = 2 * P - N  # offset
 
         # test dziury szczytowej (Lemat 2)
-        if t == 2 and not isprime(P - 2):
-            P = nextprime(P)
+        if t == 2 and not state.is_prime(P - 2):
+            state.advance()
             steps += 1
-            if P > primes[-1]:
-                primes.append(P)
             continue
 
-        e_nonzero = [e for e in E if e > 0]
-        e1, e2 = (e_nonzero + [0, 0])[:2]
+        # najmniejsze dodatnie e1, e2
+        e1, e2 = state.e1_e2
 
         # przypadek 1: domknięcie ogona
-        if t >= e1 + e2:
-            for p in primes:
-                q = N - p
-                if q <= P and isprime(q):
-                    return (N, p, q, P, steps)
-
         # przypadek 2: t w E
-        if t in E:
-            for p in primes:
-                q = N - p
-                if q <= P and isprime(q):
-                    return (N, p, q, P, steps)
-
         # przypadek 3: t w E+E
-        Eset = set(E)
-        for ei in E:
-            if (t - ei) in Eset:
-                for p in primes:
-                    q = N - p
-                    if q <= P and isprime(q):
-                        return (N, p, q, P, steps)
+        if t >= e1 + e2 or state.t_in_E(t) or state.t_in_E_plus_E():
+            found = state.search()
+            if found is not None:
+                p, q = found
+                return (N, p, q, P, steps)
 
         # zwiększamy czubek przyrostowo
-        P = nextprime(P)
+        state.advance()
         steps += 1
-        if P > primes[-1]:
-            primes.append(P)
+
+
+def goldbach_constructive_incremental(N, cross_check=False):
+    """
+    Konstrukcyjny algorytm Goldbacha (wersja inkrementalna).
+    Wykorzystuje przyrostową aktualizację struktury czubka P.
+    Zwraca (N, p, q, P) gdzie N = p + q i p, q ≤ P.
+    cross_check=True sprawdza wynik dodatkowo przez sympy.
+    """
+    return _constructive(N, cross_check)[:4]
+
+def goldbach_constructive_incremental_steps(N, cross_check=False):
+    """
+    Konstrukcyjny algorytm Goldbacha (wersja inkrementalna z liczeniem kroków).
+    Zwraca (N, p, q, P, steps), gdzie steps = ile razy zwiększano czubek P.
+    cross_check=True sprawdza wynik dodatkowo przez sympy.
+    """
+    return _constructive(N, cross_check)
 
 
 def test_goldbach_with_steps(limit_even):
@@ -0,0 +1,102 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# Copyright (c) 2025 Artur Flamandzki
+
+"""
+Wsadowy silnik Goldbacha dla całych zakresów parzystych N.
+
+Daje dokładnie te same wyniki (N, p, q, P, steps) co
+``goldbach_constructive_incremental_steps`` z Goldbach_Sum_v1.0.py,
+ale sito liczone jest raz dla całego zakresu.
+
+Dlaczego to wystarcza: dla N >= 6 czubek P jest nieparzysty, więc każdy
+rozkład N = p + q z p, q <= P daje t = 2P - N = (P - p) + (P - q),
+czyli t w E+E (przypadek 3, który obejmuje też przypadek 2, bo 0 jest
+w E).  Odwrotnie, t w E+E oznacza właśnie taki rozkład.  Test dziury
+szczytowej (t == 2, P - 2 złożone) też jest wtedy szczególnym przypadkiem
+t nie w E+E.  Pętla kończy się więc na pierwszej liczbie pierwszej
+P >= N/2, dla której istnieje rozkład z q <= P, a to jest dokładnie
+najmniejsze możliwe q, czyli q dla największego p <= N/2.  Wyszukiwanie
+rosnąco po p zwraca wtedy właśnie to p, a steps to liczba liczb
+pierwszych w [N/2, q).
+"""
+
+from math import isqrt
+
+import numpy as np
+
+from primality import prime_table
+
+# Początkowy zapas okna po obu stronach N/2; podwajany, gdy zabraknie.
+MARGIN = 1 << 12
+
+
+def segment_table(a: int, b: int) -> np.ndarray:
+    """Tablica bool is_prime dla liczb a, a+1, ..., b-1."""
+    flags = np.ones(max(b - a, 0), dtype=bool)
+    flags[:max(0, 2 - a)] = False
+    base = np.flatnonzero(prime_table(isqrt(max(b - 1, 0))))
+    for p in base.tolist():
+        start = max(p * p, (a + p - 1) // p * p)
+        flags[start - a::p] = False
+    return flags
+
+
+def store_table(store, a: int, b: int) -> np.ndarray:
+    """Jak ``segment_table``, ale z liczb pierwszych ``store.primes_in(a, b)``."""
+    flags = np.zeros(max(b - a, 0), dtype=bool)
+    flags[store.primes_in(a, b) - a] = True
+    return flags
+
+
+def goldbach_range(lo: int, hi: int, store=None):
+    """
+    Rozkłady Goldbacha dla wszystkich parzystych N, lo <= N <= hi, N >= 4.
+
+    Zwraca krotkę tablic NumPy (N, p, q, P, steps) — element po elemencie
+    równą wynikom ``goldbach_constructive_incremental_steps(N)``.
+
+    Wszystkie p i q leżą blisko N/2, więc sito obejmuje tylko okno
+    [lo/2 - zapas, hi - (lo/2 - zapas)), a nie całe 0..hi; pamięć jest
+    proporcjonalna do szerokości zakresu.
+
+    ``store`` (``PrimeStore`` z prime_window_siev/prime_store.py) podaje
+    liczby pierwsze okna z pliku zamiast sita, więc kolejne przebiegi
+    po tym samym zakresie nie sieją od nowa.
+    """
+    lo = max(lo + lo % 2, 4)
+    N = np.arange(lo, hi + 1, 2, dtype=np.int64)
+    if not N.size:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty, empty, empty, empty
+
+    half = N // 2
+    margin = MARGIN
+    while True:
+        a = max(0, int(half[0]) - margin)
+        if store is None:
+            is_prime = segment_table(a, int(N[-1]) - a + 1)
+        else:
+            is_prime = store_table(store, a, int(N[-1]) - a + 1)
+        primes = a + np.flatnonzero(is_prime).astype(np.int64)
+
+        # indeks największej liczby pierwszej <= N/2, schodzimy w dół
+        idx = np.searchsorted(primes, half, side="right") - 1
+        p = np.zeros_like(N)
+        active = np.arange(N.size)
+        while active.size and idx[active].min() >= 0:
+            cand = primes[idx[active]]
+            ok = is_prime[N[active] - cand - a]
+            p[active[ok]] = cand[ok]
+            active = active[~ok]
+            idx[active] -= 1
+
+        if not active.size:
+            break
+        if a == 0:
+            raise RuntimeError("brak rozkładu Goldbacha w zakresie")
+        margin *= 2
+
+    q = N - p
+    steps = (np.searchsorted(primes, q, side="left")
+             - np.searchsorted(primes, half, side="left"))
+    return N, p, q, q.copy(), steps
@@ -0,0 +1,159 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# Copyright (c) 2025 Artur Flamandzki
+
+"""
+Równoległe sprawdzanie Goldbacha z punktami kontrolnymi (checkpoint/resume).
+
+Zakres parzystych N dzielony jest na kawałki liczone w puli procesów
+przez ``goldbach_range``.  Z każdego kawałka zostaje tylko podsumowanie:
+maksymalna liczba kroków, wyniki ze steps > próg oraz histogram steps.
+Podsumowania dopisywane są od razu, jedno na linię JSON, do pliku
+punktu kontrolnego; po przerwaniu ponowne uruchomienie z tym samym
+plikiem pomija gotowe kawałki.  Pamięć nie rośnie z zakresem.
+
+Pierwsza linia pliku to nagłówek z parametrami przebiegu, kolejne to
+kawałki (w kolejności ukończenia, nie rosnąco).
+"""
+
+import json
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+
+from goldbach_batch import goldbach_range
+
+CHUNK = 10 ** 6
+THRESHOLD = 30
+
+
+_stores = {}
+
+
+def _open_store(path: str):
+    """PrimeStore spod ``path``, otwierany raz na proces."""
+    if path not in _stores:
+        sys.path.insert(0, os.path.join(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            "prime_window_siev"))
+        from prime_store import PrimeStore
+        _stores[path] = PrimeStore(path)
+    return _stores[path]
+
+
+def chunk_summary(lo: int, hi: int, threshold: int, store: str = None) -> dict:
+    """Podsumowanie parzystych N z [lo, hi] — tyle, ile trafia do pliku."""
+    N, p, q, P, steps = goldbach_range(
+        lo, hi, _open_store(store) if store else None)
+    over = np.flatnonzero(steps > threshold)
+    return {
+        "lo": lo,
+        "hi": hi,
+        "count": int(N.size),
+        "max_steps": int(steps.max()) if steps.size else 0,
+        "over": [[int(N[i]), int(p[i]), int(q[i]), int(P[i]), int(steps[i])]
+                 for i in over],
+        "hist": np.bincount(steps).tolist(),
+    }
+
+
+def _read_checkpoint(path: str):
+    """Nagłówek i linie kawałków; ucina niedokończoną ostatnią linię."""
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return None, []
+    with open(path, "rb+") as f:
+        data = f.read()
+        end = data.rfind(b"\n") + 1
+        if end != len(data):
+            f.truncate(end)
+    lines = [json.loads(line) for line in data[:end].splitlines() if line]
+    if not lines:
+        return None, []
+    return lines[0], lines[1:]
+
+
+def sweep(limit_even: int, checkpoint: str, lo: int = 4, chunk: int = CHUNK,
+          threshold: int = THRESHOLD, workers: int = None,
+          store: str = None) -> dict:
+    """
+    Sprawdza parzyste N z [lo, limit_even] w puli procesów.
+
+    Gotowe kawałki z ``checkpoint`` są pomijane, a nowe dopisywane na
+    bieżąco.  ``store`` to ścieżka wspólnego magazynu liczb pierwszych
+    (prime_store.py); kawałki czytają wtedy okna z niego zamiast siać.
+    Zwraca ``summarize(checkpoint)``.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunk += chunk % 2
+    header = {"lo": lo, "limit": limit_even, "chunk": chunk,
+              "threshold": threshold}
+
+    old_header, done = _read_checkpoint(checkpoint)
+    if old_header is not None and old_header != header:
+        raise ValueError(f"checkpoint {checkpoint} ma inne parametry: "
+                         f"{old_header}")
+    finished = {c["lo"] for c in done}
+    todo = (start for start in range(lo, limit_even + 1, chunk)
+            if start not in finished)
+
+    with open(checkpoint, "a") as out, \
+            ProcessPoolExecutor(max_workers=workers) as pool:
+        if old_header is None:
+            out.write(json.dumps(header) + "\n")
+            out.flush()
+
+        pending = set()
+        for start in todo:
+            if len(pending) >= 2 * workers:
+                ready, pending = wait(pending, return_when=FIRST_COMPLETED)
+                _append(out, ready)
+            end = min(start + chunk - 1, limit_even)
+            pending.add(pool.submit(chunk_summary, start, end, threshold, store))
+        _append(out, pending)
+
+    return summarize(checkpoint)
+
+
+def _append(out, futures):
+    for f in futures:
+        out.write(json.dumps(f.result()) + "\n")
+    out.flush()
+    os.fsync(out.fileno())
+
+
+def summarize(checkpoint: str) -> dict:
+    """Łączy kawałki z pliku w jedno podsumowanie (czytane strumieniowo)."""
+    header = None
+    count = max_steps = 0
+    over, hist = [], np.zeros(0, dtype=np.int64)
+
+    with open(checkpoint) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if header is None:
+                header = record
+                continue
+            count += record["count"]
+            max_steps = max(max_steps, record["max_steps"])
+            over.extend(record["over"])
+            h = np.array(record["hist"], dtype=np.int64)
+            if h.size > hist.size:
+                hist = np.pad(hist, (0, h.size - hist.size))
+            hist[:h.size] += h
+
+    over.sort()
+    return {"header": header, "count": count, "max_steps": max_steps,
+            "over": over, "hist": hist}
+
+
+if __name__ == "__main__":
+    # plik obok skryptu, niezależnie od katalogu roboczego
+    result = sweep(10 ** 7, os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "goldbach_sweep.jsonl"))
+    for N, p, q, P, steps in result["over"]:
+        print(f"{N} = {p} + {q} (P={P}, zwiększeń P: {steps})")
+    print(f"Sprawdzono {result['count']} liczb, max kroków: "
+          f"{result['max_steps']}")
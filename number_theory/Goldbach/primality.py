@@ -0,0 +1,100 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# Copyright (c) 2025 Artur Flamandzki
+
+"""
+Lokalna warstwa pierwszości dla algorytmów Goldbacha (zamiast sympy).
+
+    - n < SIEVE_BOUND: odczyt z tablicy sita, budowanej leniwie
+      i powiększanej przez podwajanie,
+    - n >= SIEVE_BOUND: deterministyczny test Millera–Rabina ze stałymi
+      bazami (pierwsze 12 liczb pierwszych), dokładny dla n < 3.18 * 10**23,
+      więc dla całego zakresu 64-bitowego.
+
+Tablica jest współdzielona przez wszystkie wywołania w procesie, więc
+kolejne N nie sieją od nowa.  Goldbach_Sum_v1.0.py korzysta z tablicy
+(``prime_table``) tylko dla N < SIEVE_BOUND; powyżej idzie przez
+``is_prime`` / ``next_prime``, więc pamięć nie rośnie z N.  Granicę można
+zmienić przypisaniem ``primality.SIEVE_BOUND = ...``.
+"""
+
+import numpy as np
+
+# Granica, poniżej której is_prime / next_prime czytają z tablicy sita.
+SIEVE_BOUND = 10 ** 7
+
+MR_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+_table = np.zeros(0, dtype=bool)
+
+
+def _sieve(limit: int) -> np.ndarray:
+    """Tablica bool is_prime[0..limit] (sito Eratostenesa w NumPy)."""
+    table = np.ones(max(limit + 1, 2), dtype=bool)
+    table[:2] = False
+    table[4::2] = False
+    for p in range(3, int(limit ** 0.5) + 1, 2):
+        if table[p]:
+            table[p * p::2 * p] = False
+    return table[:limit + 1]
+
+
+def prime_table(limit: int) -> np.ndarray:
+    """
+    Tablica bool is_prime[0..limit] (tylko do odczytu).
+
+    Zwraca widok na wspólną tablicę; jeśli jest za krótka, zostaje
+    przesiana na nowo do co najmniej dwukrotnie większej granicy.
+    """
+    global _table
+    if limit >= len(_table):
+        _table = _sieve(max(limit, 2 * len(_table)))
+        _table.flags.writeable = False
+    return _table[:limit + 1]
+
+
+def _miller_rabin(n: int) -> bool:
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in MR_BASES:
+        if a % n == 0:
+            continue
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def is_prime(n: int) -> bool:
+    """Czy n jest liczbą pierwszą."""
+    if n < 2:
+        return False
+    if n < SIEVE_BOUND:
+        return bool(prime_table(n)[n])
+    for p in MR_BASES:
+        if n % p == 0:
+            return n == p
+    return _miller_rabin(n)
+
+
+def next_prime(n: int) -> int:
+    """Najmniejsza liczba pierwsza > n (jak sympy.nextprime)."""
+    if n < 2:
+        return 2
+    if n + 1 < SIEVE_BOUND:
+        limit = min(SIEVE_BOUND - 1, 2 * n + 2)
+        hit = np.flatnonzero(prime_table(limit)[n + 1:])
+        if hit.size:
+            return n + 1 + int(hit[0])
+        n = limit
+    n += 1 + n % 2  # pierwsza nieparzysta > n
+    while not is_prime(n):
+        n += 2
+    return n
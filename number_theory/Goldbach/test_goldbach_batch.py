@@ -0,0 +1,50 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# Copyright (c) 2025 Artur Flamandzki
+
+"""goldbach_range agrees with the per-N constructive algorithm."""
+
+import importlib.util
+import os
+import sys
+
+import pytest
+
+from goldbach_batch import goldbach_range
+
+
+def _load_sum():
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        "Goldbach_Sum_v1.0.py")
+    spec = importlib.util.spec_from_file_location("goldbach_sum", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+goldbach_sum = _load_sum()
+
+
+@pytest.mark.parametrize("lo, hi", [(4, 2000), (3, 9), (99_000, 101_000),
+                                    (1_000_000, 1_000_200)])
+def test_range_matches_constructive(lo, hi):
+    rows = list(zip(*(a.tolist() for a in goldbach_range(lo, hi))))
+    expected = [goldbach_sum.goldbach_constructive_incremental_steps(N)
+                for N in range(max(lo + lo % 2, 4), hi + 1, 2)]
+    assert rows == [tuple(r) for r in expected]
+
+
+def test_empty_range():
+    for column in goldbach_range(10, 8):
+        assert column.size == 0
+
+
+def test_range_from_prime_store(tmp_path):
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                    "prime_window_siev"))
+    from prime_store import PrimeStore
+
+    store = PrimeStore(str(tmp_path / "primes.bits"))
+    for lo, hi in ((4, 3000), (500_000, 503_000)):
+        expected = goldbach_range(lo, hi)
+        for column, want in zip(goldbach_range(lo, hi, store), expected):
+            assert column.tolist() == want.tolist()
@@ -0,0 +1,66 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# Copyright (c) 2025 Artur Flamandzki
+
+"""sweep resumed from a checkpoint cut mid-line gives the uninterrupted result."""
+
+import json
+
+import numpy as np
+import pytest
+
+from goldbach_sweep import summarize, sweep
+
+LIMIT, CHUNK = 30000, 2000
+
+
+def _sweep(path, **kwargs):
+    return sweep(LIMIT, str(path), chunk=CHUNK, threshold=10, workers=2, **kwargs)
+
+
+def _assert_same(result, expected):
+    assert result["header"] == expected["header"]
+    assert (result["count"], result["max_steps"], result["over"]) == \
+        (expected["count"], expected["max_steps"], expected["over"])
+    assert np.array_equal(result["hist"], expected["hist"])
+
+
+@pytest.fixture(scope="module")
+def expected(tmp_path_factory):
+    return _sweep(tmp_path_factory.mktemp("full") / "sweep.jsonl")
+
+
+def test_resume_after_partial_last_line(tmp_path, expected):
+    full = tmp_path / "full.jsonl"
+    _sweep(full)
+    lines = full.read_bytes().splitlines(keepends=True)
+    path = tmp_path / "sweep.jsonl"
+    # header, three finished chunks and half of the fourth
+    path.write_bytes(b"".join(lines[:4]) + lines[4][:len(lines[4]) // 2])
+
+    _assert_same(_sweep(path), expected)
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    starts = [r["lo"] for r in records[1:]]
+    assert sorted(starts) == list(range(4, LIMIT + 1, CHUNK))
+    assert records[1:4] == [json.loads(line) for line in lines[1:4]]
+
+
+def test_finished_checkpoint_is_only_read(tmp_path, expected):
+    path = tmp_path / "sweep.jsonl"
+    _sweep(path)
+    before = path.read_bytes()
+    _assert_same(_sweep(path), expected)
+    assert path.read_bytes() == before
+    _assert_same(summarize(str(path)), expected)
+
+
+def test_empty_checkpoint_starts_over(tmp_path, expected):
+    path = tmp_path / "sweep.jsonl"
+    path.write_bytes(b'{"lo": 4, "li')
+    _assert_same(_sweep(path), expected)
+
+
+def test_checkpoint_of_another_run_is_rejected(tmp_path):
+    path = tmp_path / "sweep.jsonl"
+    _sweep(path)
+    with pytest.raises(ValueError):
+        sweep(LIMIT + 2, str(path), chunk=CHUNK, threshold=10, workers=2)
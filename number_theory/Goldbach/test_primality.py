@@ -0,0 +1,48 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# Copyright (c) 2025 Artur Flamandzki
+
+"""primality against sympy, and the constructive loop on both sides of SIEVE_BOUND."""
+
+import pytest
+from sympy import isprime, nextprime
+
+import primality
+from test_goldbach_batch import goldbach_sum
+
+SAMPLES = (list(range(0, 3000)) + list(range(10 ** 7 - 500, 10 ** 7 + 500))
+           + [2 ** 61 - 1, 2 ** 61 + 1, 3215031751, 3825123056546413051,
+              10 ** 18 + 9, 10 ** 18 + 7])
+
+
+def test_is_prime_matches_sympy():
+    assert [primality.is_prime(n) for n in SAMPLES] == [isprime(n) for n in SAMPLES]
+
+
+def test_next_prime_matches_sympy():
+    for n in SAMPLES[::7]:
+        assert primality.next_prime(n) == nextprime(n)
+
+
+@pytest.fixture
+def low_bound(monkeypatch):
+    # every N goes through is_prime / next_prime instead of the table
+    monkeypatch.setattr(primality, "SIEVE_BOUND", 5)
+
+
+def test_sparse_loop_matches_table_loop(low_bound):
+    ranges = (range(4, 4000, 2), range(10 ** 6, 10 ** 6 + 600, 2))
+    expected = [goldbach_sum.goldbach_constructive_incremental_steps(N)
+                for r in ranges for N in r]
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(primality, "SIEVE_BOUND", 10 ** 7)
+        table = [goldbach_sum.goldbach_constructive_incremental_steps(N)
+                 for r in ranges for N in r]
+    assert expected == table
+
+
+def test_large_n_does_not_sieve():
+    before = len(primality._table)
+    N = 10 ** 18 + 2
+    result = goldbach_sum.goldbach_constructive_incremental_steps(N, cross_check=True)
+    assert result[0] == N and result[1] + result[2] == N
+    assert len(primality._table) == before
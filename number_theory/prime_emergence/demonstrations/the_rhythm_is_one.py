@@ -1,9 +1,14 @@
 # SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
 # Copyright (c) 2025 Artur Flamandzki
 # The Rythm is one, the numbers are many
+import os
 import random
+import sys
 import time
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from emergence_history import EXACT_RNG_STEPS, SymbolTable, build_history
+
 SYMBOL_POOL = [
     "🪐","🎈","💫","⚙️","🎲","🛰️","🧩","🪄","🧪","🧭",
     "🗝️","🔮","🧲","🪁","🪅","🪞","🪙","🧬","🧯","🧱",
@@ -29,61 +34,24 @@ def step_from_latency_ms(ms_last_digit: int) -> int:
         return 3
     return ms_last_digit
 
-def choose_unique_marker(used_markers, avoid=None):
-    cand = [s for s in SYMBOL_POOL if s not in used_markers and s != avoid]
-    if not cand:
-        cand = [s for s in SYMBOL_POOL if s != avoid] or SYMBOL_POOL[:]
-    return random.choice(cand)
-
-def build_frozen_batches(max_n: int):
-    return [random.choice(CHOICES) for _ in range(max_n)]
-
-def prepare_states(max_n: int, S: int):
-    batches = build_frozen_batches(max_n)
-    position = []
-    cycles, markers, states = [], [], []
-    n = 1
-
-    while len(states) < max_n:
-        if len(states) > 0:
-            n = random.randint(1, len(states))
-
-        sym_n = batches[len(states) % len(batches)]
-        position.extend([sym_n] * S)
-
-        for i in random.sample(range(len(cycles)), len(cycles)):
-            L = len(cycles[i])
-            if L:
-                for _ in range(S):
-                    first = cycles[i].pop(0)
-                    cycles[i].append(first)
+def build_frozen_batches(max_n: int, rng=random):
+    return [rng.choice(CHOICES) for _ in range(max_n)]
 
-        hits = [i for i in range(len(cycles)) if cycles[i] and cycles[i][0] == markers[i]]
-        eliminated = len(hits) > 0
+def prepare_states(max_n: int, S: int, keep_rng_stream: bool = True,
+                   rng=random):
+    symbols = SymbolTable(SYMBOL_POOL, CHOICES)
+    batches = symbols.encode(build_frozen_batches(max_n, rng))
+    return build_history(max_n, S, batches, symbols, keep_rng_stream, rng)
 
-        if not eliminated and len(states) >= 1:
-            marker = choose_unique_marker(markers, avoid=sym_n)
-            L_new = (len(states) + 1) * S
-            new_cycle = [marker] + [sym_n] * (L_new - 1)
-            cycles.append(new_cycle)
-            markers.append(marker)
-
-        fronts = [c[0] for c in cycles if c]
-        coherent = (not eliminated) and (len(fronts) == len(set(fronts)))
-
-        states.append((
-            n, position.copy(), [c.copy() for c in cycles], markers.copy(),
-            hits.copy(), coherent, S, sym_n
-        ))
-
-    return states
-
-def show_terminal(states):
+def show_terminal(states, out=None):
+    symbols = states.symbols
+    lines = []
+    emit = lines.append
     prev_cycle_count = 0
 
     for (n, position, cycles, markers, hits, coherent, S, sym_n) in states:
         t_prime = time_map(n)
-        print(f"\n--- Krok {t_prime} | batch = {sym_n} ---")
+        emit(f"\n--- Krok {t_prime} | batch = {symbols.symbols[sym_n]} ---\n")
 
         current_count = len(cycles)
 
@@ -92,37 +60,40 @@ def show_terminal(states):
             idx = current_count
             count = len(new_cycle)
             if count > 5:
-                display = ''.join(new_cycle[:5]) + f" ({count})"
+                display = symbols.join(new_cycle[:5]) + f" ({count})"
             else:
-                display = ''.join(new_cycle) + f" ({count})"
-            print("Cykle:")
-            print(f"  cykl {idx:>2}: {display}")
+                display = symbols.join(new_cycle) + f" ({count})"
+            emit("Cykle:\n")
+            emit(f"  cykl {idx:>2}: {display}\n")
         else:
             pass
 
         if hits:
-            print("⚡ UDERZENIA cykli")
+            emit("⚡ UDERZENIA cykli\n")
         elif coherent:
-            print("🌐 Pełna synchronizacja: brak uderzeń.")
+            emit("🌐 Pełna synchronizacja: brak uderzeń.\n")
         else:
-            print("✅ Globalna zgoda: brak uderzeń, nowy cykl.")
+            emit("✅ Globalna zgoda: brak uderzeń, nowy cykl.\n")
         prev_cycle_count = current_count
     
-    print("\n=== PODSUMOWANIE KOŃCOWE ===")
+    emit("\n=== PODSUMOWANIE KOŃCOWE ===\n")
     if not states:
-        print("Brak wygenerowanych stanów.")
+        emit("Brak wygenerowanych stanów.\n")
+        (out or sys.stdout).writelines(lines)
         return
     last_state = states[-1]
     cycles = last_state[2]
 
-    print("Cykle:")
+    emit("Cykle:\n")
     for idx, cycle in enumerate(cycles, start=1):
         count = len(cycle)
         if count > 5:
-            display = ''.join(cycle[:5]) + f" ({count})"
+            display = symbols.join(cycle[:5]) + f" ({count})"
         else:
-            display = ''.join(cycle) + f" ({count})"
-        print(f"  cykl {idx:>2}: {display}")
+            display = symbols.join(cycle) + f" ({count})"
+        emit(f"  cykl {idx:>2}: {display}\n")
+
+    (out or sys.stdout).writelines(lines)
 
 def time_map(n: int) -> int:
     return int(5 * (n ** 0.5)) + n  
@@ -137,14 +108,18 @@ def run():
     if max_n < 2:
         print("Minimum to 2. Kończę.")
         return
-    if max_n > 1000:
-        print("Maksimum to 1000. Kończę.")
+    if max_n > 10 ** 6:
+        print("Maksimum to 1000000. Kończę.")
         return
 
     elapsed_ms = int((time.perf_counter() - t0) * 1000)
     S = step_from_latency_ms(elapsed_ms % 10)
 
-    states = prepare_states(max_n, S)
+    # powyżej EXACT_RNG_STEPS kroków szybki strumień losowy (inne losowania)
+    keep_rng_stream = max_n <= EXACT_RNG_STEPS
+    if not keep_rng_stream:
+        print(f"Ponad {EXACT_RNG_STEPS} kroków: szybki strumień losowy.")
+    states = prepare_states(max_n, S, keep_rng_stream)
     show_terminal(states)
 
 if __name__ == "__main__":
@@ -0,0 +1,262 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# Copyright (c) 2025 Artur Flamandzki
+
+"""
+Delta-encoded state history for the emergence simulators.
+
+Both ``structural_emergence.py`` and ``demonstrations/the_rhythm_is_one.py``
+grow the same structure: every step appends S copies of one batch symbol
+to the position and adds at most one cycle; existing cycles only rotate.
+A cycle born at step b is ``[marker] + [fill] * ((b + 1) * S - 1)`` and
+is rotated left by S on every later step, so its head offset at step k is
+S * (k - b) mod its length and its marker is back at the front exactly
+every b + 1 steps.
+
+``StateHistory`` therefore keeps only one delta per step
+``(n, sym_n, hits, coherent)``, one ``(marker, fill, birth)`` per cycle
+and, every ``keyframe`` steps, the number of cycles alive at that step.
+``history[k]`` materializes the full state tuple from the nearest keyframe
+and the deltas after it; position, cycles and markers are ``LazyList``
+views computed on read.
+
+Symbols are interned by ``SymbolTable`` to small integer codes: the
+engine and the history work on uint16 codes held in ``array`` columns,
+and only the display decodes them back to strings.
+"""
+
+import random
+from array import array
+from collections.abc import Sequence
+
+# Steps between keyframes.
+KEYFRAME = 64
+
+# Longest run the interactive entry points replay the original random
+# stream for (see ``build_history``); longer runs use the O(1) steps.
+EXACT_RNG_STEPS = 30_000
+
+
+class LazyList(Sequence):
+    """Read-only list of ``length`` items computed by ``item(i)`` on access."""
+
+    __slots__ = ("_length", "_item")
+
+    def __init__(self, length, item):
+        self._length = length
+        self._item = item
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._item(i) for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("list index out of range")
+        return self._item(index)
+
+    def __eq__(self, other):
+        return isinstance(other, Sequence) and list(self) == list(other)
+
+    def copy(self):
+        return list(self)
+
+    def __repr__(self):
+        return repr(self.copy())
+
+
+def ring_cycle(marker, fill, length, offset):
+    """Cycle ``[marker] + [fill] * (length - 1)`` rotated left by ``offset``."""
+    return LazyList(length, lambda i: marker if (i + offset) % length == 0 else fill)
+
+
+class SymbolTable:
+    """
+    Interning of a simulator's ``SYMBOL_POOL`` and ``CHOICES`` to codes.
+
+    Markers are picked by pool position, as ``choose_unique_marker`` did:
+    a bitmask holds the positions whose symbol is still unused, so a pick
+    never rebuilds a candidate list.
+    """
+
+    def __init__(self, pool, choices):
+        self.symbols = list(dict.fromkeys([*pool, *choices]))
+        self.code = {s: i for i, s in enumerate(self.symbols)}
+        self.pool = array("H", (self.code[s] for s in pool))
+        self.choices = array("H", (self.code[s] for s in choices))
+        self.full = (1 << len(pool)) - 1
+        self.positions = [0] * len(self.symbols)   # code -> its pool positions
+        for j, c in enumerate(self.pool):
+            self.positions[c] |= 1 << j
+
+    def encode(self, symbols):
+        return array("H", map(self.code.__getitem__, symbols))
+
+    def join(self, codes):
+        """Decode codes back into one display string."""
+        return "".join(self.symbols[c] for c in codes)
+
+    def pick_marker(self, free, avoid, rng=random):
+        """
+        Code of a random pool symbol among positions in ``free`` other than
+        ``avoid`` (falling back to the whole pool), drawing the same random
+        number as ``rng.choice`` over the candidate list.
+        """
+        candidates = free & ~self.positions[avoid]
+        if not candidates:
+            candidates = self.full & ~self.positions[avoid] or self.full
+        for _ in range(rng.randrange(candidates.bit_count())):
+            candidates &= candidates - 1
+        return self.pool[(candidates & -candidates).bit_length() - 1]
+
+
+class StateHistory(Sequence):
+    """
+    Random-access history of simulator states.
+
+    ``history[k]`` is ``(n, position, cycles, markers, hits, coherent, S,
+    sym_n)`` — the tuple ``show_terminal`` consumes — built on access, with
+    symbols as codes of ``history.symbols``.
+    """
+
+    def __init__(self, S, symbols, keyframe=KEYFRAME):
+        self.S = S
+        self.symbols = symbols
+        self.keyframe = keyframe
+        # per-step deltas, hits as flat indices plus start offsets
+        self.n = array("Q")
+        self.sym = array("H")
+        self.coherent = bytearray()
+        self.hits = array("Q")
+        self.hit_start = array("Q", [0])
+        # per-cycle columns
+        self.marker = array("H")
+        self.fill = array("H")
+        self.birth = array("Q")
+        # cycle count after steps 0, keyframe, 2*keyframe, ...
+        self.keyframes = array("Q")
+
+    def append(self, n, sym_n, hits, coherent, new_marker=None):
+        """Record one step; ``new_marker`` starts a cycle filled with ``sym_n``."""
+        step = len(self.n)
+        if new_marker is not None:
+            self.marker.append(new_marker)
+            self.fill.append(sym_n)
+            self.birth.append(step)
+        self.n.append(n)
+        self.sym.append(sym_n)
+        self.coherent.append(coherent)
+        self.hits.extend(hits)
+        self.hit_start.append(len(self.hits))
+        if step % self.keyframe == 0:
+            self.keyframes.append(len(self.birth))
+
+    def __len__(self):
+        return len(self.n)
+
+    def cycle_count(self, step):
+        """Number of cycles alive after ``step``."""
+        count = self.keyframes[step // self.keyframe]
+        while count < len(self.birth) and self.birth[count] <= step:
+            count += 1
+        return count
+
+    def cycle(self, i, step):
+        """Cycle i as it looks after ``step``."""
+        birth = self.birth[i]
+        length = (birth + 1) * self.S
+        return ring_cycle(self.marker[i], self.fill[i], length,
+                          self.S * (step - birth) % length)
+
+    def __getitem__(self, step):
+        if step < 0:
+            step += len(self)
+        if not 0 <= step < len(self):
+            raise IndexError("state index out of range")
+        S, sym, marker = self.S, self.sym, self.marker
+        count = self.cycle_count(step)
+        return (
+            self.n[step],
+            LazyList((step + 1) * S, lambda i: sym[i // S]),
+            LazyList(count, lambda i: self.cycle(i, step)),
+            LazyList(count, marker.__getitem__),
+            self.hits[self.hit_start[step]:self.hit_start[step + 1]].tolist(),
+            bool(self.coherent[step]), S, sym[step],
+        )
+
+
+def skip_sample(count, rng=random):
+    """
+    Consume the random numbers of ``rng.sample(range(count), count)``
+    without building the permutation: the draws of CPython's
+    ``_randbelow(m)`` for m = count, ..., 1, each one ``getrandbits`` call
+    per try.
+    """
+    getrandbits = rng.getrandbits
+    for m in range(count, 0, -1):
+        k = m.bit_length()
+        while getrandbits(k) >= m:
+            pass
+
+
+def build_history(max_n, S, batches, symbols, keep_rng_stream=True, rng=random):
+    """
+    Run the emergence dynamics for ``max_n`` steps into a ``StateHistory``.
+
+    ``batches`` are the codes of the frozen batch symbols and ``symbols``
+    the ``SymbolTable`` they come from.  Each cycle is filed under the next
+    step at which its marker returns to the front, so a step only touches
+    the cycles that collide on it.
+
+    The original loops advanced the cycles in ``random.sample`` order; the
+    order does not matter, but the call still consumes random numbers.
+    With ``keep_rng_stream`` (default) ``skip_sample`` replays its draws,
+    so a seeded run gives exactly the original states.  Cycles are born at
+    steps k with k + 1 prime, so that costs pi(k) draws at step k: about
+    1 s for 10**4 steps, 8 s for 3 * 10**4 and 80 s for 10**5.  Without
+    it every step is O(1) (10**6 steps in about 6 s), but later random
+    draws differ.
+
+    Random numbers come from ``rng``: the ``random`` module by default, or
+    a ``random.Random`` instance for an independent, seeded run.
+    """
+    history = StateHistory(S, symbols)
+    cycles = 0
+    free = symbols.full   # pool positions whose symbol is not a marker yet
+    fronts = {}           # step -> indices of cycles showing their marker
+    fill_count = [0] * len(symbols.symbols)
+    repeated = 0          # fill symbols used by more than one cycle
+
+    for step in range(max_n):
+        n = rng.randint(1, step) if step > 0 else 1
+        sym_n = batches[step % len(batches)]
+
+        if keep_rng_stream:
+            skip_sample(cycles, rng)
+
+        # Detect resonance collisions
+        hits = sorted(fronts.pop(step, ()))
+        for i in hits:
+            fronts.setdefault(step + history.birth[i] + 1, []).append(i)
+        eliminated = bool(hits)
+
+        # Old cycles show their fill at the front unless they collide,
+        # a new cycle shows its marker.
+        coherent = not eliminated and not repeated
+
+        # Create a new cycle if no collision occurred
+        marker = None
+        if not eliminated and step >= 1:
+            marker = symbols.pick_marker(free, avoid=sym_n, rng=rng)
+            coherent = coherent and not fill_count[marker]
+            fronts.setdefault(2 * step + 1, []).append(cycles)
+            cycles += 1
+            free &= ~symbols.positions[marker]
+            fill_count[sym_n] += 1
+            repeated += fill_count[sym_n] == 2
+
+        history.append(n, sym_n, hits, coherent, marker)
+
+    return history
@@ -1,7 +1,11 @@
 # SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
 # Copyright (c) 2025 Artur Flamandzki
 
-from typing import List
+import math
+import sys
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
 
 # -------------------------------------------------------------
 #  STRUCTURAL SPACE  S^S·U
@@ -51,45 +55,161 @@ def visualize_cycle(cycle: List[int]) -> str:
 # -------------------------------------------------------------
 
 
-def relational_primality_S_to_S_U(limit: int, U: int = 2) -> List[int]:
+# -------------------------------------------------------------
+#  CLOSED FORM
+# -------------------------------------------------------------
+#  A cycle born at step p has period p and relational length
+#  S^S·U = p^p·U, a multiple of p.  After the shifts of steps
+#  p+1, ..., S its phase is (S - p) mod p, so its front is active
+#  exactly when p divides S — the list never has to exist.
+#  Each cycle is filed under the next step at which it is active,
+#  and a step looks only at the cycles active on it.
+#
+#  The relational length is exact only while it fits a float; beyond
+#  that (p^p > 2^1024, from p = 149) it is carried as a logarithm.
+# -------------------------------------------------------------
+
+
+def log_relational_length(S: int, U: int) -> float:
+    """Natural logarithm of the relational length S^S·U."""
+    return S * math.log(S) + math.log(U)
+
+
+def _log_text(log_value: float) -> str:
+    """Scientific text of exp(log_value), for lengths past the float range."""
+    exponent, mantissa = divmod(log_value / math.log(10), 1)
+    mantissa = round(10 ** mantissa, 6)
+    if mantissa >= 10:
+        exponent, mantissa = exponent + 1, mantissa / 10
+    return f"{mantissa:.6f}e+{int(exponent)}"
+
+
+def length_texts(S: int, U: int):
+    """Texts of S^S·U and S^S·U / U, as printed by the original loop."""
+    if S * math.log2(S) + math.log2(U) < 1030:
+        rel_length = S ** S * U
+        try:
+            return f"{rel_length:.0f}", f"{rel_length / U:.0f}"
+        except OverflowError:
+            pass
+    log_length = log_relational_length(S, U)
+    return _log_text(log_length), _log_text(log_length - math.log(U))
+
+
+def value_projection(S: int, U: int) -> float:
+    """Projection of the relational length S^S·U onto the value axis."""
+    # ---------------------------------------------------------
+    #  CONVERSION TO VALUE SPACE (OUR DOMAIN), in log space
+    # ---------------------------------------------------------
+    #  Step 1: Normalize the cognitive grid to our unit system.
+    #          Divide by U since our space assumes U=1.
+    log_normalized = log_relational_length(S, U) - math.log(U)   # S^S
+    #  Step 2: Project onto the value axis through the S-root.
+    return math.exp(log_normalized / S)   # numerical projection
+
+
+def render_relational_primality(primes: List[int], U: int, out=None):
+    """Write one line per relational prime, in a single ``writelines``."""
+    lines = []
+    for S in primes:
+        rel_text, normalized_text = length_texts(S, U)
+        lines.append(f"Step={S} → relational length S^S·U = {rel_text}, "
+                     f"after /U = {normalized_text}, "
+                     f"value projection = {value_projection(S, U):.6g}\n")
+    (out or sys.stdout).writelines(lines)
+
+
+def relational_primality_S_to_S_U(limit: int, U: int = 2, verbose: bool = True,
+                                  on_prime: Optional[Callable[[int], None]] = None,
+                                  out=None) -> List[int]:
+    """
+    Relational primes S <= limit.  ``on_prime(S)`` is called for each one
+    as it is found; with ``verbose`` the step report is rendered to ``out``
+    (stdout) once the run is over.
+    """
     primes = []     # list of detected "relational primalities"
-    cycles: List[List[int]] = []
+    fronts: Dict[int, List[int]] = {}   # step -> periods active at that step
 
     for S in range(2, limit + 1):
-        # --- Update existing cycles (movement in relational space)
-        status = []
-        for i in range(len(cycles)):
-            cycles[i] = shift_cycle_down(cycles[i])
-            status.append(cycles[i][0] == 1)
+        # --- Cycles whose front is active at this step
+        active = fronts.pop(S, None)
+        if active:
+            for period in active:
+                fronts.setdefault(S + period, []).append(period)
+            continue
 
         # --- Identify a new relational prime
-        if not any(status):
-            primes.append(S)
-
-            # Generate structural cycle in the S^S·U space
-            new_cycle = structural_cycle_S_to_S_U(S, U)
-            rel_length = len(new_cycle)        # relational length: S^S * U
-
-            # ---------------------------------------------------------
-            #  CONVERSION TO VALUE SPACE (OUR DOMAIN)
-            # ---------------------------------------------------------
-            #  Step 1: Normalize the cognitive grid to our unit system.
-            #          Divide by U since our space assumes U=1.
-            normalized_length = rel_length / U     # S^S
-            #  Step 2: Project onto the value axis through the S-root.
-            #          This translates from relational to additive space.
-            value = normalized_length ** (1 / S)   # numerical projection
-            # ---------------------------------------------------------
-
-            print(f"Step={S} → relational length S^S·U = {rel_length:.0f}, "
-                  f"after /U = {normalized_length:.0f}, "
-                  f"value projection = {value:.6g}")
-
-            cycles.append(new_cycle)
+        primes.append(S)
+        if on_prime is not None:
+            on_prime(S)
 
+        # New cycle: period S, phase 0, next active at step 2S
+        fronts[2 * S] = [S]
+
+    if verbose:
+        render_relational_primality(primes, U, out)
     return primes
 
 
+# -------------------------------------------------------------
+#  VALUE PROJECTION
+# -------------------------------------------------------------
+#  The projection (S^S·U / U)^(1/S) should give back S itself.
+#  A float S^S overflows once S^S > 2^1024 (S >= 144), so the
+#  table below computes the projection in log space with NumPy,
+#  for all S at once, and reports its error against the exact
+#  integer S-th root of S^S·U // U.
+# -------------------------------------------------------------
+
+PROJECTION_DTYPE = np.dtype([
+    ("S", np.int64),               # detected relational prime
+    ("log10_length", np.float64),  # log10 of S^S·U
+    ("value", np.float64),         # projection (S^S·U / U)^(1/S), log space
+    ("root", np.int64),            # exact integer S-th root of S^S·U // U
+    ("error", np.float64),         # value - root
+])
+
+
+def integer_root(x: int, n: int) -> int:
+    """Largest r with r**n <= x (Newton's method on integers)."""
+    if x < 2:
+        return x
+    r = 1 << -(-x.bit_length() // n)   # 2^ceil(bits/n) >= the root
+    while True:
+        y = ((n - 1) * r + x // r ** (n - 1)) // n
+        if y >= r:
+            return r
+        r = y
+
+
+def projection_table(steps, U: int = 2, exact: bool = False) -> np.ndarray:
+    """
+    Value projections of S^S·U for every S in ``steps``, as a record array
+    of ``PROJECTION_DTYPE``.
+
+    The value is computed in log space:
+    ln(S^S·U) = S·ln S + ln U and value = exp((ln(S^S·U) - ln U) / S),
+    which never overflows.  The error is taken against the exact integer
+    root of S^S·U // U = S^S, which is S.  With ``exact=True`` that root
+    is recomputed with ``integer_root`` on the big integer S^S·U // U
+    instead of taken in closed form; that needs S^S as a big integer, so
+    it is meant for checking moderate S.
+    """
+    S = np.asarray(steps, dtype=np.int64)
+    table = np.zeros(S.size, dtype=PROJECTION_DTYPE)
+    table["S"] = S
+
+    log_length = S * np.log(S.astype(np.float64)) + math.log(U)
+    table["log10_length"] = log_length / math.log(10)
+    table["value"] = np.exp((log_length - math.log(U)) / S)
+    if exact:
+        table["root"] = [integer_root(s ** s * U // U, s) for s in S.tolist()]
+    else:
+        table["root"] = S
+    table["error"] = table["value"] - table["root"]
+    return table
+
+
 # -------------------------------------------------------------
 #  OPERATIONAL LAYER
 # -------------------------------------------------------------
@@ -103,6 +223,11 @@ if __name__ == "__main__":
     print("\nEmergent primes in S^S·U space:", result)
     print("Number of emergent primes:", len(result))
 
+    table = projection_table(result, U=2, exact=True)
+    if table.size:
+        print("Max |value projection - exact root|:",
+              float(np.abs(table["error"]).max()))
+
 
 # -------------------------------------------------------------
 #  STRUCTURAL COMMENTARY
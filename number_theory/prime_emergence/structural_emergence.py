@@ -20,8 +20,14 @@ S — Structural iteration step (resonance order or cycle length)
 Cycles — Represent evolving relational clusters in structural space
 """
 
+import os
 import random
+import sys
 import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from emergence_history import EXACT_RNG_STEPS, SymbolTable, build_history
 
 
 # ============================================================
@@ -103,77 +109,100 @@ def step_from_latency_ms(ms_last_digit: int) -> int:
     return ms_last_digit
 
 
-def choose_unique_marker(used_markers, avoid=None):
-    """Select a new unique symbol to mark a newly formed cycle."""
-    candidates = [s for s in SYMBOL_POOL if s not in used_markers and s != avoid]
-    if not candidates:
-        candidates = [s for s in SYMBOL_POOL if s != avoid] or SYMBOL_POOL[:]
-    return random.choice(candidates)
-
-
-def build_frozen_batches(max_n: int):
+def build_frozen_batches(max_n: int, rng=random):
     """Generate a static set of base symbols representing frozen resonance states."""
-    return [random.choice(CHOICES) for _ in range(max_n)]
+    return [rng.choice(CHOICES) for _ in range(max_n)]
 
 
-def prepare_states(max_n: int, S: int):
+def prepare_states(max_n: int, S: int, keep_rng_stream: bool = True,
+                   rng=random):
     """
     Create the sequence of structural states.
     Each state represents an iteration in which new cycles may form or stabilize.
+
+    Returns a ``StateHistory``: per-step deltas from which ``states[k]`` is
+    rebuilt on access as ``(n, position, cycles, markers, hits, coherent,
+    S, sym_n)``, with symbols as integer codes of ``states.symbols``.
+    New cycles are marked with unused ``SYMBOL_POOL`` symbols.  See
+    ``emergence_history.build_history`` for ``keep_rng_stream``.
     """
-    batches = build_frozen_batches(max_n)
-    position = []
-    cycles, markers, states = [], [], []
+    symbols = SymbolTable(SYMBOL_POOL, CHOICES)
+    batches = symbols.encode(build_frozen_batches(max_n, rng))
+    return build_history(max_n, S, batches, symbols, keep_rng_stream, rng)
 
-    while len(states) < max_n:
-        if len(states) > 0:
-            n = random.randint(1, len(states))
-        else:
-            n = 1
 
-        sym_n = batches[len(states) % len(batches)]
-        position.extend([sym_n] * S)
+# ============================================================
+# Ensembles
+# ============================================================
 
-        # Advance all existing cycles
-        for i in random.sample(range(len(cycles)), len(cycles)):
-            for _ in range(S):
-                first = cycles[i].pop(0)
-                cycles[i].append(first)
+ENSEMBLE_COLUMNS = ("S", "seed", "collision_steps", "collisions",
+                    "coherent_steps", "cycles")
 
-        # Detect resonance collisions
-        hits = [i for i in range(len(cycles)) if cycles[i] and cycles[i][0] == markers[i]]
-        eliminated = bool(hits)
 
-        # Create a new cycle if no collision occurred
-        if not eliminated and len(states) >= 1:
-            marker = choose_unique_marker(markers, avoid=sym_n)
-            new_cycle_length = (len(states) + 1) * S
-            new_cycle = [marker] + [sym_n] * (new_cycle_length - 1)
-            cycles.append(new_cycle)
-            markers.append(marker)
+def _ensemble_run(task):
+    """Summary of one seeded run, in ``ENSEMBLE_COLUMNS`` order."""
+    max_n, S, seed, variant, keep_rng_stream = task
+    global SYMBOL_POOL, CHOICES
+    SYMBOL_POOL, CHOICES = get_symbol_sets(variant)
+    states = prepare_states(max_n, S, keep_rng_stream, random.Random(seed))
+    starts = states.hit_start
+    collision_steps = sum(starts[k] != starts[k + 1] for k in range(len(states)))
+    return (S, seed, collision_steps, len(states.hits),
+            sum(states.coherent), len(states.birth))
 
-        fronts = [c[0] for c in cycles if c]
-        coherent = (not eliminated) and (len(fronts) == len(set(fronts)))
 
-        states.append((
-            n, position.copy(), [c.copy() for c in cycles],
-            markers.copy(), hits.copy(), coherent, S, sym_n
-        ))
+def run_ensemble(max_n: int, S_values, seeds, workers: int = None,
+                 variant: int = 1, keep_rng_stream: bool = False):
+    """
+    Run ``prepare_states`` for every (S, seed) pair in a process pool.
+
+    Each run draws from its own ``random.Random(seed)``, so the result
+    depends only on the arguments, not on ``workers``.  Runs take the
+    O(1) steps by default, like ``python -m relmath structural``; with
+    ``keep_rng_stream`` a row matches a serial ``prepare_states`` call
+    with the same S and seed, at the per-run cost given in
+    ``build_history``.  States are not
+    kept; each run is reduced to one row and the rows, in (S, seed) order,
+    are returned as columns — a dict of ``array('q')`` keyed by
+    ``ENSEMBLE_COLUMNS``:
+        S, seed          — run parameters
+        collision_steps  — steps with at least one cycle collision
+        collisions       — cycle collisions in total
+        coherent_steps   — fully synchronized steps
+        cycles           — cycles alive after the last step
+    """
+    workers = workers or os.cpu_count() or 1
+    tasks = [(max_n, S, seed, variant, keep_rng_stream)
+             for S in S_values for seed in seeds]
+    columns = {name: array("q") for name in ENSEMBLE_COLUMNS}
+
+    # runs always go to worker processes, which set their own symbol sets
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        chunksize = max(1, len(tasks) // (4 * workers))
+        for row in pool.map(_ensemble_run, tasks, chunksize=chunksize):
+            for name, value in zip(ENSEMBLE_COLUMNS, row):
+                columns[name].append(value)
 
-    return states
+    return columns
 
 
 # ============================================================
 # Display and Analysis
 # ============================================================
 
-def show_terminal(states):
-    """Display the progression of cycles and resonances in the terminal."""
+def show_terminal(states, out=None):
+    """
+    Display the progression of cycles and resonances in the terminal
+    (or ``out``); the whole report is written in one ``writelines`` call.
+    """
+    symbols = states.symbols
+    lines = []
+    emit = lines.append
     prev_cycle_count = 0
 
     for (n, position, cycles, markers, hits, coherent, S, sym_n) in states:
         t_prime = time_map(n)
-        print(f"\n--- Step {t_prime} | Batch Symbol = {sym_n} ---")
+        emit(f"\n--- Step {t_prime} | Batch Symbol = {symbols.symbols[sym_n]} ---\n")
 
         current_count = len(cycles)
 
@@ -181,30 +210,33 @@ def show_terminal(states):
             new_cycle = cycles[-1]
             idx = current_count
             count = len(new_cycle)
-            display = ''.join(new_cycle[:5]) + f" ({count})" if count > 5 else ''.join(new_cycle) + f" ({count})"
-            print("Cycles:")
-            print(f"  cycle {idx:>2}: {display}")
+            display = symbols.join(new_cycle[:5]) + f" ({count})" if count > 5 else symbols.join(new_cycle) + f" ({count})"
+            emit("Cycles:\n")
+            emit(f"  cycle {idx:>2}: {display}\n")
 
         if hits:
-            print("⚡ Cycle collisions detected")
+            emit("⚡ Cycle collisions detected\n")
         elif coherent:
-            print("🌐 Full synchronization: no collisions.")
+            emit("🌐 Full synchronization: no collisions.\n")
         else:
-            print("✅ Stable resonance: no collisions, new cycle formed.")
+            emit("✅ Stable resonance: no collisions, new cycle formed.\n")
 
         prev_cycle_count = current_count
 
-    print("\n=== FINAL SUMMARY ===")
+    emit("\n=== FINAL SUMMARY ===\n")
     if not states:
-        print("No states generated.")
+        emit("No states generated.\n")
+        (out or sys.stdout).writelines(lines)
         return
 
     last_cycles = states[-1][2]
-    print("Cycles:")
+    emit("Cycles:\n")
     for idx, cycle in enumerate(last_cycles, start=1):
         count = len(cycle) // S
-        display = ''.join(cycle[:5]) + f" ({count})" if count > 5 else ''.join(cycle) + f" ({count})"
-        print(f"  cycle {idx:>2}: {display}")
+        display = symbols.join(cycle[:5]) + f" ({count})" if count > 5 else symbols.join(cycle) + f" ({count})"
+        emit(f"  cycle {idx:>2}: {display}\n")
+
+    (out or sys.stdout).writelines(lines)
 
 
 # ============================================================
@@ -221,7 +253,13 @@ def time_map(n: int) -> int:
 # ============================================================
 
 def run():
-    """Interactive entry point for the simulation."""
+    """
+    Interactive entry point for the simulation.
+
+    Up to ``EXACT_RNG_STEPS`` steps (30 000, about 8 s) the states follow
+    the original random stream; longer runs, up to 10**6 steps, switch to
+    the O(1) steps of ``build_history`` and draw different numbers.
+    """
     t0 = time.perf_counter()
 
     try:
@@ -233,8 +271,8 @@ def run():
     if max_n < 2:
         print("Minimum is 2. Exiting.")
         return
-    if max_n > 1000:
-        print("Maximum is 1000. Exiting.")
+    if max_n > 10 ** 6:
+        print("Maximum is 1000000. Exiting.")
         return
 
     elapsed_ms = int((time.perf_counter() - t0) * 1000)
@@ -244,7 +282,10 @@ def run():
     global SYMBOL_POOL, CHOICES
     SYMBOL_POOL, CHOICES = get_symbol_sets(variant=1)
 
-    states = prepare_states(max_n, S)
+    keep_rng_stream = max_n <= EXACT_RNG_STEPS
+    if not keep_rng_stream:
+        print(f"More than {EXACT_RNG_STEPS} steps: using the fast random stream.")
+    states = prepare_states(max_n, S, keep_rng_stream)
     show_terminal(states)
 
 
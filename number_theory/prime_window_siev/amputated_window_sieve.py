@@ -0,0 +1,154 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# Copyright (c) 2025 Artur Flamandzki
+
+"""
+Amputated window sieve — NumPy engine for ``window_sieve_amputated``.
+
+The arithmetic is amputated by a set of removed primes: every multiple of
+a removed prime does not exist at all.  Starting from the base {P_min},
+each window (P_max, P_min*P_max] keeps only the existing numbers, crosses
+off multiples of the current base, and the survivors become the next
+generation.
+
+Instead of an ``exists`` dict over 2..N the existence mask is a periodic
+wheel of length lcm(removed primes) tiled over each segment of the
+window; removed primes that would make the wheel too long are crossed
+off with strided slices like the base.  Memory is proportional to the
+segment plus the base, never to N.
+"""
+
+from math import isqrt, lcm
+
+import numpy as np
+
+from segmented_window_sieve import base_primes
+
+# Numbers per segment (one bool each).
+SEGMENT_SIZE = 1 << 18
+
+# Longest wheel kept as a tiled pattern: 2*3*5*7*11*13*17.
+WHEEL_LIMIT = 510510
+
+
+def build_wheel(removed_primes, limit: int = WHEEL_LIMIT):
+    """
+    Split the removed primes into a periodic existence pattern and a rest.
+
+    Returns ``(pattern, rest)``: ``pattern[n % len(pattern)]`` is False for
+    every n divisible by one of the wheel primes, and ``rest`` lists the
+    removed primes that did not fit under ``limit``.
+    """
+    period = 1
+    wheel, rest = [], []
+    for p in sorted(set(removed_primes)):
+        if lcm(period, p) <= limit:
+            period = lcm(period, p)
+            wheel.append(p)
+        else:
+            rest.append(p)
+
+    pattern = np.ones(period, dtype=bool)
+    for p in wheel:
+        pattern[::p] = False
+    return pattern, rest
+
+
+def _tile(pattern: np.ndarray, lo: int, length: int) -> np.ndarray:
+    """Return pattern values for lo, lo+1, ..., lo+length-1."""
+    period = len(pattern)
+    offset = lo % period
+    reps = (offset + length + period - 1) // period
+    return np.tile(pattern, reps)[offset:offset + length]
+
+
+def _cross_off(flags: np.ndarray, lo: int, steps: np.ndarray):
+    """Clear every multiple of each step in [lo, lo + len(flags))."""
+    m = len(flags)
+    if not steps.size:
+        return
+    idx = (lo + steps - 1) // steps * steps - lo
+    small = steps < m
+    for p, i in zip(steps[small].tolist(), idx[small].tolist()):
+        flags[i::p] = False
+    once = idx[~small]
+    flags[once[once < m]] = False
+
+
+def amputated_segment(lo: int, hi: int, pattern: np.ndarray, rest: np.ndarray,
+                      base: np.ndarray) -> np.ndarray:
+    """Return the existing numbers in [lo, hi) that no base element divides."""
+    flags = _tile(pattern, lo, hi - lo)
+    _cross_off(flags, lo, rest)
+    _cross_off(flags, lo, base)
+    return lo + np.flatnonzero(flags).astype(np.int64)
+
+
+def crossing_limit(real_R: int, P_min: int, removed_primes, k0: int) -> int:
+    """
+    Largest base element that can still cross off something up to real_R.
+
+    When every prime below P_min is removed, each existing composite has a
+    prime factor between P_min and sqrt(real_R), and that prime is already
+    in the base, so isqrt(real_R) is enough.  For other removed sets a base
+    element b only matters if b*k0 <= real_R, where k0 is the smallest
+    existing number above 1.
+    """
+    if set(base_primes(P_min - 1).tolist()) <= set(removed_primes):
+        return isqrt(real_R)
+    return real_R // k0
+
+
+def window_sieve_amputated_vectorized(N: int, P_min: int, removed_primes=None,
+                                      segment_size: int = SEGMENT_SIZE):
+    """
+    Run the amputated window sieve up to N without printing.
+
+    ``removed_primes`` defaults to every prime below P_min.  Returns
+    ``(primes, windows)`` in the layout of ``window_sieve_segmented``:
+    an int64 array starting with P_min, and ``(P_max, R, count,
+    new_P_max)`` per window.
+    """
+    if removed_primes is None:
+        removed_primes = base_primes(P_min - 1).tolist()
+    removed_primes = sorted(set(int(p) for p in removed_primes))
+    pattern, rest = build_wheel(removed_primes)
+    rest = np.array(rest, dtype=np.int64)
+
+    k0 = 2
+    while any(k0 % p == 0 for p in removed_primes):
+        k0 += 1
+
+    chunks = [np.array([P_min], dtype=np.int64)]
+    windows = []
+    P_max = P_min
+
+    while True:
+        L = P_max + 1
+        R = P_min * P_max
+
+        if L > N:
+            break
+
+        real_R = min(R, N)
+
+        base = np.concatenate(chunks)
+        limit = crossing_limit(real_R, P_min, removed_primes, k0)
+        base = base[base <= limit]
+        found_chunks = []
+
+        for lo in range(L, real_R + 1, segment_size):
+            found = amputated_segment(lo, min(lo + segment_size, real_R + 1),
+                                      pattern, rest, base)
+            if found.size:
+                found_chunks.append(found)
+
+        if not found_chunks:
+            break
+
+        count = sum(int(f.size) for f in found_chunks)
+        new_P_max = int(found_chunks[-1][-1])
+        windows.append((P_max, real_R, count, new_P_max))
+        chunks.extend(found_chunks)
+        P_max = new_P_max
+
+    return np.concatenate(chunks), windows
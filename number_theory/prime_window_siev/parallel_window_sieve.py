@@ -0,0 +1,205 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# Copyright (c) 2025 Artur Flamandzki
+
+"""
+Parallel window sieve — process-pool sharding of the window engines.
+
+The windows are still visited one after another, because each window's
+P_max is the largest prime of the previous one.  Inside a window the range
+(P_max, R] is cut into shards that a ``ProcessPoolExecutor`` sieves
+independently; the shards come back in order and are merged, so the
+output is identical to ``window_sieve_segmented`` and
+``window_sieve_amputated_vectorized``.
+
+The base used to cross off a window is written once per window into a
+``multiprocessing.shared_memory`` block; tasks carry only its name and
+length, never the array itself.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from math import isqrt
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from amputated_window_sieve import (
+    amputated_segment, build_wheel, crossing_limit,
+)
+from segmented_window_sieve import SEGMENT_SIZE, base_primes, segment_primes
+
+# Smallest shard handed to a worker; shorter windows are sieved in-process.
+MIN_SHARD = 1 << 21
+
+# Shards per worker and window, so uneven shards still balance out.
+SHARDS_PER_WORKER = 4
+
+
+# ============================================================
+# Shared base
+# ============================================================
+
+_attached = {}
+_wheel = None
+
+
+def _share(base: np.ndarray):
+    """Copy the base into a new shared memory block."""
+    shm = shared_memory.SharedMemory(create=True, size=max(base.nbytes, 1))
+    np.ndarray(base.shape, dtype=np.int64, buffer=shm.buf)[:] = base
+    return shm
+
+
+def _attach(name: str, size: int) -> np.ndarray:
+    """Return the shared base ``name`` inside a worker, attaching once."""
+    if name not in _attached:
+        for shm, _ in _attached.values():
+            shm.close()
+        _attached.clear()
+        shm = shared_memory.SharedMemory(name=name)
+        _attached[name] = (shm, np.ndarray((size,), dtype=np.int64,
+                                           buffer=shm.buf))
+    return _attached[name][1]
+
+
+def _init_wheel(pattern, rest):
+    global _wheel
+    _wheel = (pattern, rest)
+
+
+# ============================================================
+# Shard tasks
+# ============================================================
+
+def _plain_shard(task, base=None):
+    name, size, lo, hi, segment_size, collect = task
+    if base is None:
+        base = _attach(name, size)
+    span = 2 * segment_size
+    return _merge((segment_primes(s, min(s + span, hi), base)
+                   for s in range(lo, hi, span)), collect)
+
+
+def _amputated_shard(task, base=None):
+    name, size, lo, hi, segment_size, collect = task
+    if base is None:
+        base = _attach(name, size)
+    pattern, rest = _wheel
+    return _merge((amputated_segment(s, min(s + segment_size, hi),
+                                     pattern, rest, base)
+                   for s in range(lo, hi, segment_size)), collect)
+
+
+def _merge(segments, collect: bool):
+    """Reduce a shard's segments to ``(count, last, primes or None)``."""
+    found = [f for f in segments if f.size]
+    count = sum(int(f.size) for f in found)
+    last = int(found[-1][-1]) if found else 0
+    primes = np.concatenate(found) if collect and found else None
+    return count, last, primes
+
+
+def _shards(L: int, R: int, workers: int):
+    """Split [L, R] into ordered half-open shards."""
+    width = R + 1 - L
+    shard = max(MIN_SHARD, -(-width // (workers * SHARDS_PER_WORKER)))
+    return [(lo, min(lo + shard, R + 1)) for lo in range(L, R + 1, shard)]
+
+
+def _sieve_windows(N, P_min, P_max, chunks, next_base, shard_task,
+                   pool, workers, segment_size, collect_primes):
+    """Drive the window loop, handing each window's shards to the pool."""
+    windows = []
+
+    while True:
+        L = P_max + 1
+        R = P_min * P_max
+
+        if L > N:
+            break
+
+        real_R = min(R, N)
+
+        base = next_base(real_R)
+        shards = _shards(L, real_R, workers)
+        if len(shards) == 1:
+            lo, hi = shards[0]
+            results = [shard_task((None, 0, lo, hi, segment_size,
+                                   collect_primes), base)]
+        else:
+            shm = _share(base)
+            try:
+                tasks = [(shm.name, base.size, lo, hi, segment_size,
+                          collect_primes) for lo, hi in shards]
+                results = list(pool.map(shard_task, tasks))
+            finally:
+                shm.close()
+                shm.unlink()
+
+        count = sum(c for c, _, _ in results)
+        if count == 0:
+            break
+
+        new_P_max = max(last for _, last, _ in results)
+        windows.append((P_max, real_R, count, new_P_max))
+        if collect_primes:
+            chunks.extend(p for _, _, p in results if p is not None)
+        P_max = new_P_max
+
+    return windows
+
+
+# ============================================================
+# Public engines
+# ============================================================
+
+def window_sieve_parallel(N: int, workers: int = None,
+                          segment_size: int = SEGMENT_SIZE,
+                          collect_primes: bool = True):
+    """
+    Parallel ``window_sieve_segmented``: same ``(primes, windows)`` result.
+    """
+    workers = workers or os.cpu_count() or 1
+    base = base_primes(isqrt(max(N, 0)))
+    chunks = [np.array([2], dtype=np.int64)]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        windows = _sieve_windows(
+            N, 2, 2, chunks, lambda real_R: base, _plain_shard,
+            pool, workers, segment_size, collect_primes)
+
+    primes = np.concatenate(chunks) if collect_primes else None
+    return primes, windows
+
+
+def window_sieve_amputated_parallel(N: int, P_min: int, removed_primes=None,
+                                    workers: int = None,
+                                    segment_size: int = SEGMENT_SIZE):
+    """
+    Parallel ``window_sieve_amputated_vectorized``: same ``(primes, windows)``.
+    """
+    workers = workers or os.cpu_count() or 1
+    if removed_primes is None:
+        removed_primes = base_primes(P_min - 1).tolist()
+    removed_primes = sorted(set(int(p) for p in removed_primes))
+    pattern, rest = build_wheel(removed_primes)
+    rest = np.array(rest, dtype=np.int64)
+
+    k0 = 2
+    while any(k0 % p == 0 for p in removed_primes):
+        k0 += 1
+
+    chunks = [np.array([P_min], dtype=np.int64)]
+
+    def next_base(real_R):
+        base = np.concatenate(chunks)
+        return base[base <= crossing_limit(real_R, P_min, removed_primes, k0)]
+
+    _init_wheel(pattern, rest)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_wheel,
+                             initargs=(pattern, rest)) as pool:
+        windows = _sieve_windows(
+            N, P_min, P_min, chunks, next_base, _amputated_shard,
+            pool, workers, segment_size, True)
+
+    return np.concatenate(chunks), windows
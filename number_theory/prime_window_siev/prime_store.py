@@ -0,0 +1,286 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# Copyright (c) 2025 Artur Flamandzki
+
+"""
+Prime store — persistent, memory-mapped cache of sieved primes.
+
+Primes are written once by the segmented window sieve and kept on disk as
+an odd-only bitmap: bit j of byte b stands for the number 2*(8*b + j) + 1.
+Next to it a small index holds the running prime count at every block
+boundary, so ``pi(n)`` touches at most one block.  Both files are opened
+with ``mmap`` (through ``np.memmap``), so a new process answers queries
+straight from the page cache instead of sieving again.
+
+When a range query (``pi``, ``primes_in``, ``next_prime``) goes past the
+cached range the store extends itself block by block, sieving only the new
+part, up to ``max_limit`` (MAX_LIMIT, 2^32: a 256 MiB bitmap).  Queries
+at or above ``max_limit`` leave the files as they are:
+
+    - ``is_prime`` and ``next_prime`` ask ``Goldbach/primality.py``
+      (Miller-Rabin for large n),
+    - ``primes_in`` sieves the part above the store in memory (a range
+      starting below ``max_limit`` still extends the files up to it),
+    - ``pi`` counts the part above the store by sieving it in memory,
+      block by block, which takes time proportional to n - limit.
+
+Opening and extending the files hold an exclusive ``flock`` on
+``<path>.lock``, so processes sharing one store never see or truncate
+each other's half-written blocks.
+
+    store = PrimeStore()            # data/primes.bits by default
+    store.is_prime(97), store.pi(10**6), store.next_prime(10**9)
+"""
+
+import os
+import sys
+from contextlib import contextmanager
+from math import isqrt
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:     # Windows: no advisory locks, single process only
+    fcntl = None
+
+from segmented_window_sieve import base_primes, segment_primes
+
+NUMBER_THEORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(NUMBER_THEORY, "Goldbach"))
+import primality
+
+# Bitmap bytes per index block; one block covers 16 * BLOCK_BYTES numbers.
+BLOCK_BYTES = 1 << 16
+BLOCK_SPAN = 16 * BLOCK_BYTES
+
+# Queries extend the store at most this far (a multiple of BLOCK_SPAN).
+MAX_LIMIT = 1 << 32
+
+DEFAULT_PATH = os.environ.get(
+    "RELMATH_PRIME_STORE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                 "..", "..", "data", "primes.bits"),
+)
+
+
+class PrimeStore:
+    """Memory-mapped prime bitmap with prefix counts, extended on demand."""
+
+    def __init__(self, path: str = DEFAULT_PATH, limit: int = 0,
+                 max_limit: int = MAX_LIMIT):
+        self.path = os.path.abspath(path)
+        self.max_limit = max(BLOCK_SPAN, max_limit // BLOCK_SPAN * BLOCK_SPAN)
+        self.index_path = self.path + ".pi"
+        self.lock_path = self.path + ".lock"
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._bits = None
+        self._counts = None
+        with self._locked():
+            self._open()
+        if limit > self.limit:
+            self.extend(limit)
+
+    # --------------------------------------------------------
+    # File handling
+    # --------------------------------------------------------
+
+    @contextmanager
+    def _locked(self):
+        """Exclusive lock shared by every process using this store."""
+        with open(self.lock_path, "a") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _open(self):
+        # called with the lock held
+        for p in (self.path, self.index_path):
+            if not os.path.exists(p):
+                open(p, "wb").close()
+
+        blocks = min(os.path.getsize(self.path) // BLOCK_BYTES,
+                     max(os.path.getsize(self.index_path) // 8 - 1, 0))
+        # drop a half-written tail left by an interrupted extension
+        if os.path.getsize(self.path) != blocks * BLOCK_BYTES:
+            os.truncate(self.path, blocks * BLOCK_BYTES)
+        if blocks == 0 and os.path.getsize(self.index_path) != 8:
+            with open(self.index_path, "wb") as f:
+                f.write(np.zeros(1, dtype=np.uint64).tobytes())
+        elif os.path.getsize(self.index_path) != (blocks + 1) * 8:
+            os.truncate(self.index_path, (blocks + 1) * 8)
+
+        self.blocks = blocks
+        self._bits = (np.memmap(self.path, dtype=np.uint8, mode="r")
+                      if blocks else np.zeros(0, dtype=np.uint8))
+        self._counts = np.memmap(self.index_path, dtype=np.uint64, mode="r")
+
+    def close(self):
+        self._bits = None
+        self._counts = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def limit(self) -> int:
+        """Every n < limit is covered by the cache."""
+        return self.blocks * BLOCK_SPAN
+
+    def extend(self, limit: int):
+        """Sieve and append whole blocks until the cache covers n < limit."""
+        target = -(-limit // BLOCK_SPAN)
+        if target <= self.blocks:
+            return
+        with self._locked():
+            # another process may have extended the files meanwhile
+            self.close()
+            self._open()
+            if target > self.blocks:
+                self._append(target)
+                self._open()
+
+    def _append(self, target: int):
+        base = base_primes(isqrt(target * BLOCK_SPAN))
+        total = int(self._counts[-1])
+        new_counts = []
+        self.close()
+
+        with open(self.path, "ab") as bits, open(self.index_path, "ab") as idx:
+            for block in range(self.blocks, target):
+                lo = block * BLOCK_SPAN
+                found = segment_primes(lo, lo + BLOCK_SPAN, base)
+                odd = found[found > 2]
+                flags = np.zeros(8 * BLOCK_BYTES, dtype=bool)
+                flags[(odd - lo) // 2] = True
+                bits.write(np.packbits(flags, bitorder="little").tobytes())
+                total += int(found.size)
+                new_counts.append(total)
+            bits.flush()
+            idx.write(np.array(new_counts, dtype=np.uint64).tobytes())
+
+    def _ensure(self, n: int):
+        """Extend the files to cover n when n < ``max_limit``; else leave them."""
+        if self.limit <= n < self.max_limit:
+            self.extend(min(max(n + 1, 2 * self.limit), self.max_limit))
+
+    def _sieve_above(self, a: int, b: int):
+        """Yield the primes in [a, b) by blocks, sieved in memory."""
+        base = base_primes(isqrt(b - 1))
+        for lo in range(a, b, BLOCK_SPAN):
+            yield segment_primes(lo, min(lo + BLOCK_SPAN, b), base)
+
+    # --------------------------------------------------------
+    # Queries
+    # --------------------------------------------------------
+
+    def is_prime(self, n: int) -> bool:
+        if n < 3:
+            return n == 2
+        if n % 2 == 0:
+            return False
+        if n >= self.limit:
+            return primality.is_prime(n)
+        j = n // 2
+        return bool((self._bits[j >> 3] >> (j & 7)) & 1)
+
+    def _odd_flags(self, a: int, b: int):
+        """Unpacked odd-only flags for the bytes covering [a, b)."""
+        first = a // 16
+        last = -(-b // 16)
+        flags = np.unpackbits(self._bits[first:last], bitorder="little")
+        return first * 16, flags
+
+    def primes_in(self, a: int, b: int) -> np.ndarray:
+        """Return the primes p with a <= p < b (like ``primerange``)."""
+        a = max(a, 0)
+        if b <= a:
+            return np.zeros(0, dtype=np.int64)
+        if a < self.max_limit:
+            self._ensure(min(b, self.max_limit) - 1)
+        parts = []
+        stored = min(b, self.limit)
+        if a < stored:
+            start, flags = self._odd_flags(a, stored)
+            found = start + 2 * np.flatnonzero(flags).astype(np.int64) + 1
+            parts.append(found[(found >= a) & (found < stored)])
+            if a <= 2 < stored:
+                parts.insert(0, np.array([2], dtype=np.int64))
+        if b > self.limit:
+            parts.extend(self._sieve_above(max(a, self.limit), b))
+        if not parts:
+            return np.zeros(0, dtype=np.int64)
+        return np.concatenate(parts)
+
+    def next_prime(self, n: int) -> int:
+        """Return the smallest prime greater than n."""
+        if n < 2:
+            return 2
+        self._ensure(n + 1)
+        lo = n + 1
+        while True:
+            if lo >= self.limit:
+                return primality.next_prime(lo - 1)
+            hi = min(lo + BLOCK_SPAN, self.limit)
+            found = self.primes_in(lo, hi)
+            if found.size:
+                return int(found[0])
+            lo = hi
+
+    def pi(self, n: int) -> int:
+        """Return the number of primes <= n."""
+        if n < 2:
+            return 0
+        self._ensure(n)
+        if n >= self.limit:
+            count = int(self._counts[-1])
+            for found in self._sieve_above(self.limit, n + 1):
+                count += int(found.size)
+            return count
+        block = (n + 1) // BLOCK_SPAN
+        lo = block * BLOCK_SPAN
+        count = int(self._counts[block])
+        if n + 1 > lo:
+            count += int(self.primes_in(lo, n + 1).size)
+        return count
+
+
+# ------------------------------------------------------------
+# Window sieve answered from the store
+# ------------------------------------------------------------
+
+def window_sieve_stored(N: int, store: PrimeStore = None,
+                        collect_primes: bool = True):
+    """
+    ``window_sieve_segmented`` read from the store: same ``(primes, windows)``.
+
+    Each window (P_max, 2·P_max] costs two ``pi`` lookups and one short
+    ``primes_in`` for its largest prime, so once the store covers N a run
+    takes milliseconds instead of a sieve pass.
+    """
+    store = store or PrimeStore(limit=N + 1)
+    windows = []
+    P_max = 2
+
+    while P_max + 1 <= N:
+        real_R = min(2 * P_max, N)
+        count = store.pi(real_R) - store.pi(P_max)
+        if count == 0:
+            break
+        span = 1 << 10
+        while True:
+            tail = store.primes_in(max(P_max + 1, real_R + 1 - span), real_R + 1)
+            if tail.size:
+                break
+            span *= 2
+        windows.append((P_max, real_R, count, int(tail[-1])))
+        P_max = int(tail[-1])
+
+    primes = store.primes_in(2, max(P_max, 2) + 1) if collect_primes else None
+    return primes, windows
@@ -0,0 +1,121 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# Copyright (c) 2025 Artur Flamandzki
+
+"""
+Segmented window sieve — bounded-memory engine for ``window_sieve``.
+
+The windows are exactly the ones of ``window_sievie.window_sieve``:
+start from the base {2}, sieve the window (P_max, 2*P_max], take the
+survivors as the next generation of primes and move P_max to the largest
+of them.  Instead of a dict over the whole window, every window is
+walked in fixed-size segments of odd numbers held in a NumPy bool array,
+so peak memory is O(sqrt(N) + segment) and nothing is printed.
+
+Only base primes p with p*p <= R are needed to cross off a window,
+because every window (P_max, 2*P_max] lies below P_max**2 — the
+survivors are the same as with the full base.
+"""
+
+from math import isqrt
+
+import numpy as np
+
+# Odd numbers per segment: 2**18 flags = 256 KiB, sized to stay in L2.
+SEGMENT_SIZE = 1 << 18
+
+
+def base_primes(limit: int) -> np.ndarray:
+    """Return all primes <= limit as an int64 array (odd-only sieve)."""
+    if limit < 2:
+        return np.zeros(0, dtype=np.int64)
+    flags = np.ones((limit + 1) // 2, dtype=bool)   # flags[i] <-> 2*i + 1
+    flags[0] = False
+    for i in range(1, (isqrt(limit) - 1) // 2 + 1):
+        if flags[i]:
+            p = 2 * i + 1
+            flags[p * p // 2::p] = False
+    odd = 2 * np.flatnonzero(flags).astype(np.int64) + 1
+    return np.concatenate((np.array([2], dtype=np.int64), odd))
+
+
+def segment_primes(lo: int, hi: int, primes: np.ndarray) -> np.ndarray:
+    """
+    Return the primes in [lo, hi) as an int64 array.
+
+    ``primes`` must contain every prime <= isqrt(hi - 1).  Only odd
+    numbers are stored; 2 is added back when it falls into the range.
+    """
+    lo = max(lo, 2)
+    if hi <= lo:
+        return np.zeros(0, dtype=np.int64)
+    first = lo | 1
+    m = max(0, (hi - first + 1) // 2)   # odd numbers first, first+2, ... < hi
+    flags = np.ones(m, dtype=bool)
+
+    top = isqrt(hi - 1)
+    ps = primes[1:np.searchsorted(primes, top, side="right")]
+    if ps.size:
+        start = np.maximum(ps * ps, (first + ps - 1) // ps * ps)
+        start += ps * (start % 2 == 0)           # first odd multiple
+        idx = (start - first) // 2
+
+        # primes below the segment length hit it many times: strided slices
+        small = ps < m
+        for p, i in zip(ps[small].tolist(), idx[small].tolist()):
+            flags[i::p] = False
+        # larger primes hit it at most once: one fancy-indexed write
+        once = idx[~small]
+        flags[once[once < m]] = False
+
+    found = first + 2 * np.flatnonzero(flags).astype(np.int64)
+    if lo == 2:
+        found = np.concatenate((np.array([2], dtype=np.int64), found))
+    return found
+
+
+def window_sieve_segmented(N: int, segment_size: int = SEGMENT_SIZE,
+                           collect_primes: bool = True):
+    """
+    Run the window-doubling sieve up to N without printing.
+
+    Returns ``(primes, windows)``:
+        primes  — int64 array of all primes found (None if collect_primes
+                  is False, which keeps memory at O(sqrt(N) + segment)),
+        windows — list of ``(P_max, R, count, new_P_max)`` per window
+                  (P_max, R], where count is the number of new primes and
+                  new_P_max the largest of them.
+    """
+    P_min = 2
+    P_max = 2
+    base = base_primes(isqrt(max(N, 0)))
+    chunks = [np.array([2], dtype=np.int64)]
+    windows = []
+    span = 2 * segment_size
+
+    while True:
+        L = P_max + 1
+        R = P_min * P_max
+
+        if L > N:
+            break
+
+        real_R = min(R, N)
+
+        count = 0
+        new_P_max = 0
+        for lo in range(L, real_R + 1, span):
+            found = segment_primes(lo, min(lo + span, real_R + 1), base)
+            if found.size:
+                count += int(found.size)
+                new_P_max = int(found[-1])
+                if collect_primes:
+                    chunks.append(found)
+
+        if count == 0:
+            break
+
+        windows.append((P_max, real_R, count, new_P_max))
+        P_max = new_P_max
+
+    primes = np.concatenate(chunks) if collect_primes else None
+    return primes, windows
@@ -0,0 +1,60 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# Copyright (c) 2025 Artur Flamandzki
+
+"""Every window sieve engine gives the same primes and windows."""
+
+import io
+
+import pytest
+
+import parallel_window_sieve
+from window_sieve_amputated import window_sieve_amputated
+from window_sievie import window_sieve
+
+
+def _plain(result):
+    primes, windows = result
+    return [int(p) for p in primes], [tuple(int(v) for v in w) for w in windows]
+
+
+@pytest.fixture
+def small_shards(monkeypatch):
+    # shards of 1 KiB numbers, so even small N goes through the pool
+    monkeypatch.setattr(parallel_window_sieve, "MIN_SHARD", 1 << 10)
+
+
+@pytest.mark.parametrize("N", [2, 3, 10, 1000, 30000])
+def test_window_sieve_engines_agree(N, small_shards):
+    expected = _plain(window_sieve(N, verbose=False))
+    assert _plain(window_sieve(N, engine="segmented")) == expected
+    assert _plain(window_sieve(N, engine="parallel", workers=2)) == expected
+
+
+def test_windows_without_primes(small_shards):
+    expected = window_sieve(30000, engine="segmented")
+    for engine in ("segmented", "parallel"):
+        result = window_sieve(30000, engine=engine, workers=2, collect_primes=False)
+        assert result.primes is None
+        assert result.window_table().tolist() == expected.window_table().tolist()
+        out = io.StringIO()
+        window_sieve(1000, engine=engine, verbose=True, out=out, collect_primes=False)
+        assert out.getvalue().endswith("Len: 168\n")
+
+
+@pytest.mark.parametrize("N, P_min", [(1000, 2), (5000, 7), (30000, 11),
+                                      (30000, 43), (60000, 47), (60000, 97)])
+def test_amputated_engines_agree(N, P_min, small_shards):
+    expected = window_sieve_amputated(N, P_min, verbose=False)
+    for engine in ("numpy", "parallel"):
+        result = window_sieve_amputated(N, P_min, engine=engine, workers=2)
+        assert _plain(result) == _plain(expected)
+        assert result.removed_primes == expected.removed_primes
+
+
+def test_amputated_removed_primes_parameter(small_shards):
+    results = [window_sieve_amputated(5000, 7, engine=engine, verbose=False,
+                                      workers=2, removed_primes=[3, 2])
+               for engine in ("dict", "numpy", "parallel")]
+    assert results[0].removed_primes == [2, 3]
+    assert _plain(results[1]) == _plain(results[0])
+    assert _plain(results[2]) == _plain(results[0])
@@ -0,0 +1,110 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# Copyright (c) 2025 Artur Flamandzki
+
+"""Prime store queries against a reference, reopening, locking and the extension cap."""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+from sympy import isprime, nextprime, primepi
+
+import prime_store
+from prime_store import BLOCK_SPAN, PrimeStore, window_sieve_stored
+from segmented_window_sieve import base_primes
+from window_sievie import window_sieve
+
+REFERENCE = base_primes(3 * BLOCK_SPAN)
+
+
+def _store(tmp_path, **kwargs):
+    return PrimeStore(str(tmp_path / "primes.bits"), **kwargs)
+
+
+def _size(tmp_path):
+    return os.path.getsize(tmp_path / "primes.bits")
+
+
+def test_queries_match_reference(tmp_path):
+    store = _store(tmp_path)
+    for a, b in ((0, 3), (0, 1000), (2, 3), (3, 100), (BLOCK_SPAN - 50, BLOCK_SPAN + 50),
+                 (5, 5), (2 * BLOCK_SPAN + 1, 3 * BLOCK_SPAN)):
+        expected = REFERENCE[(REFERENCE >= a) & (REFERENCE < b)]
+        assert store.primes_in(a, b).tolist() == expected.tolist()
+    for n in (0, 1, 2, 3, 4, 100, BLOCK_SPAN - 1, BLOCK_SPAN, 2 * BLOCK_SPAN + 7):
+        assert store.pi(n) == int(np.searchsorted(REFERENCE, n, side="right"))
+        assert store.next_prime(n) == nextprime(n)
+    sample = list(range(-3, 2000)) + list(range(BLOCK_SPAN - 100, BLOCK_SPAN + 100))
+    assert [store.is_prime(n) for n in sample] == [n > 1 and isprime(n) for n in sample]
+
+
+def test_reopen_reads_without_sieving(tmp_path, monkeypatch):
+    _store(tmp_path, limit=2 * BLOCK_SPAN).close()
+
+    def no_sieving(*args):
+        raise AssertionError("reopened store sieved again")
+
+    monkeypatch.setattr(prime_store, "segment_primes", no_sieving)
+    store = _store(tmp_path)
+    assert store.limit == 2 * BLOCK_SPAN
+    assert store.pi(2 * BLOCK_SPAN - 1) == primepi(2 * BLOCK_SPAN - 1)
+
+
+def test_extend_appends_blocks(tmp_path):
+    store = _store(tmp_path, limit=BLOCK_SPAN)
+    assert store.limit == BLOCK_SPAN
+    store.extend(3 * BLOCK_SPAN - 5)
+    assert store.limit == 3 * BLOCK_SPAN
+    assert _store(tmp_path).pi(3 * BLOCK_SPAN - 1) == len(REFERENCE)
+
+
+def test_truncated_tail_is_dropped(tmp_path):
+    _store(tmp_path, limit=2 * BLOCK_SPAN).close()
+    os.truncate(tmp_path / "primes.bits", _size(tmp_path) - 10)
+    store = _store(tmp_path)
+    assert store.limit == BLOCK_SPAN
+    assert store.pi(2 * BLOCK_SPAN - 1) == primepi(2 * BLOCK_SPAN - 1)
+
+
+def _extend_and_count(args):
+    path, blocks = args
+    store = PrimeStore(path)
+    store.extend(blocks * BLOCK_SPAN)
+    return store.pi(blocks * BLOCK_SPAN - 1)
+
+
+def test_concurrent_extensions(tmp_path):
+    path = str(tmp_path / "primes.bits")
+    sizes = [3, 1, 2, 3, 2, 1]
+    with ProcessPoolExecutor(4) as pool:
+        counts = list(pool.map(_extend_and_count, [(path, k) for k in sizes]))
+    assert counts == [primepi(k * BLOCK_SPAN - 1) for k in sizes]
+    assert PrimeStore(path).limit == 3 * BLOCK_SPAN
+
+
+def test_big_n_does_not_grow_the_file(tmp_path):
+    store = _store(tmp_path, limit=BLOCK_SPAN)
+    size = _size(tmp_path)
+    assert store.is_prime(10 ** 18 + 9) and not store.is_prime(10 ** 18 + 11)
+    assert store.next_prime(10 ** 15) == nextprime(10 ** 15)
+    assert _size(tmp_path) == size
+
+
+def test_queries_stop_at_max_limit(tmp_path):
+    store = _store(tmp_path, max_limit=2 * BLOCK_SPAN)
+    a, b = 2 * BLOCK_SPAN - 100, 3 * BLOCK_SPAN
+    assert store.primes_in(a, b).tolist() == REFERENCE[REFERENCE >= a].tolist()
+    assert store.limit == 2 * BLOCK_SPAN
+    assert store.pi(3 * BLOCK_SPAN) == len(REFERENCE)
+    assert store.next_prime(3 * BLOCK_SPAN) == nextprime(3 * BLOCK_SPAN)
+    assert store.limit == 2 * BLOCK_SPAN
+    assert _size(tmp_path) == 2 * prime_store.BLOCK_BYTES
+
+
+@pytest.mark.parametrize("N", [2, 3, 10, 1000, 300_000])
+def test_window_sieve_from_store(tmp_path, N):
+    expected = window_sieve(N, engine="segmented")
+    primes, windows = window_sieve_stored(N, _store(tmp_path))
+    assert primes.tolist() == expected.primes.tolist()
+    assert windows == [tuple(int(v) for v in w) for w in expected.windows]
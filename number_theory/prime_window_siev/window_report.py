@@ -0,0 +1,116 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# Copyright (c) 2025 Artur Flamandzki
+
+"""
+Structured results and text rendering for the window sieves.
+
+Every engine returns a ``SieveResult``; nothing is printed while sieving.
+The renderers rebuild the original console report from the result and
+hand it to the output stream in a single ``writelines`` call, so a
+headless run that never renders pays nothing for formatting.
+
+``SieveResult`` still unpacks as ``primes, windows`` like the tuples the
+array engines returned before.
+"""
+
+import sys
+from dataclasses import dataclass, field
+
+import numpy as np
+
+WINDOW_DTYPE = np.dtype([
+    ("P_max", np.int64),
+    ("R", np.int64),
+    ("count", np.int64),
+    ("new_P_max", np.int64),
+])
+
+
+@dataclass(slots=True)
+class SieveResult:
+    """
+    Outcome of a window sieve up to N.
+
+        primes          — all primes found, in window order (list or int64
+                          array; None if the engine did not collect them)
+        windows         — ``(P_max, R, count, new_P_max)`` per window
+        removed_primes  — primes amputated from the arithmetic (if any)
+    """
+
+    N: int
+    P_min: int
+    primes: object
+    windows: list
+    removed_primes: list = field(default_factory=list)
+
+    def __iter__(self):
+        return iter((self.primes, self.windows))
+
+    def window_table(self) -> np.ndarray:
+        """Windows as a record array of ``WINDOW_DTYPE``."""
+        return np.array([tuple(w) for w in self.windows], dtype=WINDOW_DTYPE)
+
+    def window_primes(self):
+        """Yield ``(window, new_primes)``; new_primes is None without primes."""
+        start = 1
+        for window in self.windows:
+            count = window[2]
+            if self.primes is None:
+                yield window, None
+            else:
+                yield window, _as_list(self.primes[start:start + count])
+            start += count
+
+    def stopped_at_empty_window(self):
+        """The window (P_max, R] that came out empty, or None if N was reached."""
+        P_max = self.windows[-1][3] if self.windows else self.P_min
+        if P_max + 1 > self.N:
+            return None
+        return P_max, min(self.P_min * P_max, self.N)
+
+
+def _as_list(values):
+    return values.tolist() if isinstance(values, np.ndarray) else list(values)
+
+
+def _write(lines, out):
+    (out or sys.stdout).writelines(lines)
+
+
+def render_window_sieve(result: SieveResult, out=None):
+    """Write the report of ``window_sievie.window_sieve``."""
+    P_min = result.P_min
+    lines = [f"Start: base = [{P_min}], window = ({P_min}, {P_min * P_min}]\n"]
+    for (P_max, R, count, new_P_max), new_primes in result.window_primes():
+        shown = new_primes if new_primes is not None else f"{count} primes"
+        lines.append(f"In the window ({P_max}, {R}] new primes: {shown}\n")
+        lines.append(f"New window: ({new_P_max}, {P_min * new_P_max}]\n")
+
+    primes = result.primes
+    if primes is None:
+        total = 1 + sum(w[2] for w in result.windows)
+        lines.append(f"\nFinished. Primes up to {result.N}, Len: {total}\n")
+    else:
+        lines.append(f"\nFinished. Primes up to {result.N}, Len: {len(primes)}: "
+                     f"{sorted(_as_list(primes))}\n")
+    _write(lines, out)
+
+
+def render_window_sieve_amputated(result: SieveResult, out=None):
+    """Write the (Polish) report of ``window_sieve_amputated``."""
+    P_min = result.P_min
+    lines = [f"Start: baza = [{P_min}], okno = ({P_min}, {P_min * P_min}]\n",
+             f"Usunięte pierwsze: {_as_list(result.removed_primes)}\n\n"]
+    for (P_max, R, count, new_P_max), new_primes in result.window_primes():
+        lines.append(f"W oknie ({P_max}, {R}] nowe liczby pierwsze: {new_primes}\n")
+        lines.append(f"Nowe okno: ({new_P_max}, {P_min * new_P_max}]\n\n")
+
+    empty = result.stopped_at_empty_window()
+    if empty is not None:
+        lines.append(f"W oknie ({empty[0]}, {empty[1]}] brak nowych liczb.\n")
+
+    lines.append(f"\nZakończono. Liczby pierwsze (w amputowanej arytmetyce) "
+                 f"do {result.N}:\n")
+    lines.append(f"{sorted(_as_list(result.primes))}\n")
+    lines.append(f"Łącznie: {len(result.primes)}\n")
+    _write(lines, out)
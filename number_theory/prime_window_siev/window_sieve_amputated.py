@@ -1,7 +1,53 @@
-def window_sieve_amputated(N, P_min):
-    # Wszystkie prime < P_min usuwamy
-    removed_primes = [p for p in [2,3,5,7,11,13,17,19,23,29,31,37,41] if p < P_min]
-
+from window_report import SieveResult, render_window_sieve_amputated
+
+
+def primes_below(n):
+    # wszystkie liczby pierwsze < n (małe sito Eratostenesa, bez numpy)
+    flags = bytearray([1]) * max(n, 2)
+    flags[0] = flags[1] = 0
+    for p in range(2, int(n ** 0.5) + 1):
+        if flags[p]:
+            flags[p * p::p] = bytes(len(range(p * p, n, p)))
+    return [p for p in range(2, n) if flags[p]]
+
+
+def window_sieve_amputated(N, P_min, engine="dict", verbose=None,
+                           on_window=None, out=None, workers=None,
+                           removed_primes=None):
+    # engine="numpy" używa wektorowego silnika (koło okresowe zamiast słownika);
+    # engine="parallel" to samo, z oknami dzielonymi na wszystkie rdzenie
+    # (albo na `workers` procesów).
+    # removed_primes: liczby pierwsze usunięte z arytmetyki; domyślnie
+    # wszystkie pierwsze < P_min.  Ten sam zbiór trafia do każdego silnika,
+    # więc wybór engine nie zmienia wyniku.
+    # Każdy silnik zwraca SieveResult (rozpakowuje się jako primes, windows).
+    # verbose wypisuje raport przez render_window_sieve_amputated do out
+    # (stdout); domyślnie wypisuje tylko silnik "dict", jak dotąd.
+    # on_window(P_max, R, new_primes) wołane jest dla każdego okna.
+    if removed_primes is None:
+        removed_primes = primes_below(P_min)
+    removed_primes = sorted(set(int(p) for p in removed_primes))
+
+    if engine == "numpy":
+        from amputated_window_sieve import window_sieve_amputated_vectorized
+        primes, windows = window_sieve_amputated_vectorized(N, P_min, removed_primes)
+    elif engine == "parallel":
+        from parallel_window_sieve import window_sieve_amputated_parallel
+        primes, windows = window_sieve_amputated_parallel(N, P_min, removed_primes,
+                                                          workers)
+    else:
+        primes, windows = _window_sieve_amputated_dict(N, P_min, removed_primes)
+
+    result = SieveResult(N, P_min, primes, windows, removed_primes)
+    if on_window is not None:
+        for (P_max, R, _, _), new_primes in result.window_primes():
+            on_window(P_max, R, new_primes)
+    if verbose or (verbose is None and engine == "dict"):
+        render_window_sieve_amputated(result, out)
+    return result
+
+
+def _window_sieve_amputated_dict(N, P_min, removed_primes):
     # przestrzeń liczb, które W OGÓLE istnieją
     exists = {n: True for n in range(2, N+1)}
 
@@ -13,9 +59,7 @@ def window_sieve_amputated(N, P_min):
     # start algorytmu
     primes = [P_min]
     P_max = P_min
-
-    print(f"Start: baza = {primes}, okno = ({P_max}, {P_min * P_max}]")
-    print(f"Usunięte pierwsze: {removed_primes}\n")
+    windows = []
 
     while True:
         L = P_max + 1
@@ -40,24 +84,18 @@ def window_sieve_amputated(N, P_min):
         new_primes = [n for n, ok in window.items() if ok]
 
         if not new_primes:
-            print(f"W oknie ({P_max}, {real_R}] brak nowych liczb.")
             break
 
-        print(f"W oknie ({P_max}, {real_R}] nowe liczby pierwsze: {new_primes}")
-
         primes.extend(new_primes)
         new_P_max = new_primes[-1]
+        windows.append((P_max, real_R, len(new_primes), new_P_max))
 
         if new_P_max > N:
             break
 
         P_max = new_P_max
 
-        print(f"Nowe okno: ({P_max}, {P_min * P_max}]\n")
-
-    print(f"\nZakończono. Liczby pierwsze (w amputowanej arytmetyce) do {N}:")
-    print(sorted(primes))
-    print(f"Łącznie: {len(primes)}")
+    return primes, windows
 
 
 if __name__ == "__main__":
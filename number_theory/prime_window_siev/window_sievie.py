@@ -1,9 +1,48 @@
-def window_sieve(N):
+from window_report import SieveResult, render_window_sieve
+
+
+def window_sieve(N, engine="dict", verbose=None, on_window=None, out=None,
+                 workers=None, collect_primes=True):
+    # engine="segmented" runs the bit-packed, bounded-memory engine instead;
+    # engine="parallel" does the same with windows sharded over all cores
+    # (or over `workers` processes); engine="store" reads the windows from
+    # the shared prime store (prime_store.py), sieving only what it lacks.
+    # Every engine returns a SieveResult (unpacks as primes, windows).
+    # verbose writes the report through render_window_sieve to out (stdout);
+    # by default only the dict engine prints, as it always did.
+    # on_window(P_max, R, new_primes) is called for every window.
+    # collect_primes=False keeps only the windows (primes is None, new_primes
+    # too) so the array engines run in memory independent of the prime count;
+    # the dict engine always collects.
+    if engine == "segmented":
+        from segmented_window_sieve import window_sieve_segmented
+        primes, windows = window_sieve_segmented(
+            N, collect_primes=collect_primes)
+    elif engine == "parallel":
+        from parallel_window_sieve import window_sieve_parallel
+        primes, windows = window_sieve_parallel(
+            N, workers, collect_primes=collect_primes)
+    elif engine == "store":
+        from prime_store import window_sieve_stored
+        primes, windows = window_sieve_stored(
+            N, collect_primes=collect_primes)
+    else:
+        primes, windows = _window_sieve_dict(N)
+
+    result = SieveResult(N, 2, primes, windows)
+    if on_window is not None:
+        for (P_max, R, _, _), new_primes in result.window_primes():
+            on_window(P_max, R, new_primes)
+    if verbose or (verbose is None and engine == "dict"):
+        render_window_sieve(result, out)
+    return result
+
+
+def _window_sieve_dict(N):
     P_min = 2
     primes = [2]
     P_max = 2
-
-    print(f"Start: base = {primes}, window = ({P_max}, {P_min * P_max}]")
+    windows = []
 
     while True:
         L = P_max + 1
@@ -31,11 +70,10 @@ def window_sieve(N):
             # no new primes ≤ N
             break
 
-        print(f"In the window ({P_max}, {real_R}] new primes: {new_primes}")
-
         # update the base
         primes.extend(new_primes)
         new_P_max = new_primes[-1]   # largest prime in the window
+        windows.append((P_max, real_R, len(new_primes), new_P_max))
 
         # if it exceeded N – stop
         if new_P_max > N:
@@ -43,9 +81,7 @@ def window_sieve(N):
 
         P_max = new_P_max
 
-        print(f"New window: ({P_max}, {P_min * P_max}]")
-
-    print(f"\nFinished. Primes up to {N}, Len: {len(primes)}: {sorted(primes)}")
+    return primes, windows
 
 
 if __name__ == "__main__":
@@ -0,0 +1,39 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# Copyright (c) 2025 Artur Flamandzki
+
+"""
+Command-line front end for the Relational Mathematics tools.
+
+    python -m relmath <tool> --n N [--workers W] [--output PATH]
+                      [--format {json,npy,csv}] [--profile PATH] [--time]
+
+The tools stay plain scripts in their own directories; ``load`` puts a
+script's directory on ``sys.path`` (so its sibling imports work) and
+imports it, also when the file name is not a valid module name.
+"""
+
+import importlib
+import importlib.util
+import os
+import sys
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load(directory: str, filename: str):
+    """Import ``<repo>/<directory>/<filename>`` as a module."""
+    path = os.path.join(REPO, directory)
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+    name = os.path.splitext(filename)[0]
+    if name.isidentifier():
+        return importlib.import_module(name)
+
+    alias = "relmath_" + "".join(c if c.isalnum() else "_" for c in name)
+    if alias not in sys.modules:
+        spec = importlib.util.spec_from_file_location(alias, os.path.join(path, filename))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[alias] = module
+        spec.loader.exec_module(module)
+    return sys.modules[alias]
@@ -0,0 +1,101 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# Copyright (c) 2025 Artur Flamandzki
+
+"""
+``python -m relmath <tool> --n N ...`` — run a tool non-interactively.
+
+    --output PATH            write there instead of stdout (required for npy)
+    --format {json,npy,csv}  output format of the result table
+    --workers W              worker processes (window-sieve, amputated and
+                             structural, the tools that use a pool)
+    --profile PATH           dump cProfile stats of the run to PATH
+    --time                   report load / compute / write timings on stderr
+"""
+
+import argparse
+import csv
+import cProfile
+import json
+import pstats
+import sys
+import time
+
+import numpy as np
+
+
+def build_parser():
+    from relmath.tools import TOOLS
+
+    parser = argparse.ArgumentParser(prog="python -m relmath")
+    sub = parser.add_subparsers(dest="tool", required=True, metavar="tool")
+    for name, (help_text, add_arguments, _) in TOOLS.items():
+        p = sub.add_parser(name, help=help_text, description=help_text)
+        p.add_argument("--n", type=int, required=True,
+                       help="upper bound / number of steps")
+        p.add_argument("--output", default=None, help="output file (default: stdout)")
+        p.add_argument("--format", choices=("json", "npy", "csv"), default="json")
+        p.add_argument("--profile", metavar="PATH", default=None,
+                       help="write cProfile stats to PATH")
+        p.add_argument("--time", action="store_true",
+                       help="report phase timings on stderr")
+        if add_arguments is not None:
+            add_arguments(p)
+    return parser
+
+
+def write_table(table: np.ndarray, fmt: str, output, meta: dict):
+    if fmt == "npy":
+        if output is None:
+            raise SystemExit("--format npy needs --output")
+        np.save(output, table)
+        return
+
+    out = open(output, "w", newline="") if output else sys.stdout
+    try:
+        if fmt == "csv":
+            writer = csv.writer(out)
+            writer.writerow(table.dtype.names)
+            writer.writerows(table.tolist())
+        else:
+            columns = {name: table[name].tolist() for name in table.dtype.names}
+            json.dump({**meta, "rows": len(table), "columns": columns}, out,
+                      ensure_ascii=False)
+            out.write("\n")
+    finally:
+        if output:
+            out.close()
+
+
+def main(argv=None):
+    t0 = time.perf_counter()
+    from relmath.tools import TOOLS
+
+    args = build_parser().parse_args(argv)
+    run = TOOLS[args.tool][2]
+    timings = {"load": time.perf_counter() - t0}
+
+    t = time.perf_counter()
+    if args.profile:
+        profiler = cProfile.Profile()
+        table = profiler.runcall(run, args)
+        profiler.dump_stats(args.profile)
+    else:
+        table = run(args)
+    timings["compute"] = time.perf_counter() - t
+
+    t = time.perf_counter()
+    params = {k: v for k, v in vars(args).items()
+              if k not in ("tool", "output", "format", "profile", "time")}
+    write_table(table, args.format, args.output, {"tool": args.tool, "params": params})
+    timings["write"] = time.perf_counter() - t
+
+    if args.profile:
+        pstats.Stats(args.profile, stream=sys.stderr).sort_stats("cumulative").print_stats(15)
+    if args.time:
+        for phase, seconds in timings.items():
+            print(f"{phase:>8}: {seconds:.3f} s", file=sys.stderr)
+        print(f"{'total':>8}: {sum(timings.values()):.3f} s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# Copyright (c) 2025 Artur Flamandzki
+
+"""
+Display detection shared by the plotting scripts.
+
+Scripts that draw with matplotlib pick the headless Agg backend when
+``has_display()`` is false, so they also run over SSH and in CI.
+"""
+
+import os
+import sys
+
+
+def has_display():
+    """Whether an interactive window can be opened at all."""
+    if sys.platform in ("win32", "darwin"):
+        return True
+    return bool(os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
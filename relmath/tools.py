@@ -0,0 +1,193 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# Copyright (c) 2025 Artur Flamandzki
+
+"""
+The tools behind ``python -m relmath``.
+
+Each tool adds its own options to a subparser and turns the parsed
+arguments into one NumPy record array, which the CLI then writes as
+JSON, CSV or ``.npy``.  Nothing is printed while computing.
+"""
+
+import random
+
+import numpy as np
+
+from relmath import load
+
+
+def _table(**columns) -> np.ndarray:
+    """Record array from equally long columns."""
+    arrays = [np.asarray(c) for c in columns.values()]
+    dtype = [(name, a.dtype) for name, a in zip(columns, arrays)]
+    table = np.zeros(len(arrays[0]) if arrays else 0, dtype=dtype)
+    for name, a in zip(columns, arrays):
+        table[name] = a
+    return table
+
+
+# ------------------------------------------------------------
+# Window sieves
+# ------------------------------------------------------------
+
+def _workers_argument(parser):
+    # only for tools whose run() hands args.workers to a process pool
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes (default: all cores)")
+
+
+def _sieve_arguments(parser, engines=("dict", "segmented", "numpy", "parallel")):
+    _workers_argument(parser)
+    parser.add_argument("--engine", default="segmented", choices=engines,
+                        help="segmented and numpy both mean the array engine")
+    parser.add_argument("--primes", action="store_true",
+                        help="output the primes instead of the windows")
+
+
+def _sieve_table(result, args):
+    if args.primes:
+        return _table(p=np.asarray(result.primes, dtype=np.int64))
+    return result.window_table()
+
+
+def window_sieve_arguments(parser):
+    # "store" reads the windows from the shared prime store (prime_store.py)
+    _sieve_arguments(parser, ("dict", "segmented", "numpy", "parallel", "store"))
+
+
+def window_sieve(args):
+    sieve = load("number_theory/prime_window_siev", "window_sievie.py")
+    engine = "segmented" if args.engine == "numpy" else args.engine
+    # without --primes only the windows are kept, not every prime found
+    result = sieve.window_sieve(args.n, engine=engine, verbose=False,
+                                workers=args.workers, collect_primes=args.primes)
+    return _sieve_table(result, args)
+
+
+def amputated_arguments(parser):
+    _sieve_arguments(parser)
+    parser.add_argument("--p-min", type=int, required=True,
+                        help="smallest prime kept in the arithmetic")
+    parser.add_argument("--removed", type=int, nargs="+", default=None,
+                        help="primes removed from the arithmetic "
+                             "(default: every prime below --p-min)")
+
+
+def window_sieve_amputated(args):
+    sieve = load("number_theory/prime_window_siev", "window_sieve_amputated.py")
+    engine = "numpy" if args.engine == "segmented" else args.engine
+    result = sieve.window_sieve_amputated(args.n, args.p_min, engine=engine,
+                                          verbose=False, workers=args.workers,
+                                          removed_primes=args.removed)
+    return _sieve_table(result, args)
+
+
+# ------------------------------------------------------------
+# CRT cycles, Goldbach, S^S·U projection
+# ------------------------------------------------------------
+
+def congruence_cycles(args):
+    engine = load("number_theory/CRT", "cycle_engine.py")
+    return _table(n=np.array(engine.discover_cycles(args.n), dtype=np.int64))
+
+
+def goldbach(args):
+    batch = load("number_theory/Goldbach", "goldbach_batch.py")
+    store = None
+    if args.store:
+        store = load("number_theory/prime_window_siev", "prime_store.py").PrimeStore(args.store)
+    N, p, q, P, steps = batch.goldbach_range(args.lo, args.n, store)
+    return _table(N=N, p=p, q=q, P=P, steps=steps)
+
+
+def goldbach_arguments(parser):
+    parser.add_argument("--lo", type=int, default=4, help="smallest even N")
+    parser.add_argument("--store", metavar="PATH", default=None,
+                        help="read primes from this prime store instead of sieving")
+
+
+def projection(args):
+    selfref = load("number_theory/prime_emergence", "selfreferential_emergence.py")
+    primes = selfref.relational_primality_S_to_S_U(args.n, args.u, verbose=False)
+    return selfref.projection_table(primes, args.u)
+
+
+def projection_arguments(parser):
+    parser.add_argument("--u", type=int, default=2, help="grid constant U")
+
+
+# ------------------------------------------------------------
+# Emergence simulators
+# ------------------------------------------------------------
+
+def _emergence_arguments(parser):
+    parser.add_argument("--S", type=int, nargs="+", default=[10],
+                        help="structural step(s)")
+    parser.add_argument("--seed", type=int, nargs="+", default=[0],
+                        help="random seed(s); several S or seeds run an ensemble")
+    parser.add_argument("--exact-rng", action="store_true",
+                        help="keep the original random stream (slower: about 8 s"
+                             " per run of 30000 steps)")
+
+
+def emergence_arguments(parser):
+    _emergence_arguments(parser)
+    _workers_argument(parser)
+    parser.add_argument("--variant", type=int, default=1,
+                        help="symbol set: 1 formal, 2 runic, 3 geometric")
+
+
+def _history_table(states):
+    steps = len(states)
+    new_cycle = np.zeros(steps, dtype=bool)
+    new_cycle[np.frombuffer(states.birth, dtype=np.uint64).astype(np.int64)] = True
+    return _table(
+        step=np.arange(steps, dtype=np.int64),
+        n=np.frombuffer(states.n, dtype=np.uint64).astype(np.int64),
+        symbol=np.array(states.symbols.symbols)[np.frombuffer(states.sym, dtype=np.uint16)],
+        hits=np.diff(np.frombuffer(states.hit_start, dtype=np.uint64)).astype(np.int64),
+        coherent=np.frombuffer(bytes(states.coherent), dtype=bool),
+        new_cycle=new_cycle,
+    )
+
+
+def structural_emergence(args):
+    emergence = load("number_theory/prime_emergence", "structural_emergence.py")
+    if len(args.S) > 1 or len(args.seed) > 1:
+        columns = emergence.run_ensemble(args.n, args.S, args.seed, args.workers,
+                                         args.variant, args.exact_rng)
+        return _table(**{name: np.array(col, dtype=np.int64)
+                         for name, col in columns.items()})
+
+    emergence.SYMBOL_POOL, emergence.CHOICES = emergence.get_symbol_sets(args.variant)
+    states = emergence.prepare_states(args.n, args.S[0], args.exact_rng,
+                                      random.Random(args.seed[0]))
+    return _history_table(states)
+
+
+def rhythm(args):
+    demo = load("number_theory/prime_emergence/demonstrations", "the_rhythm_is_one.py")
+    if len(args.S) > 1 or len(args.seed) > 1:
+        raise SystemExit("the_rhythm_is_one runs one S and one seed at a time")
+    states = demo.prepare_states(args.n, args.S[0], args.exact_rng,
+                                 random.Random(args.seed[0]))
+    return _history_table(states)
+
+
+# name -> (help, add extra arguments, run)
+TOOLS = {
+    "window-sieve": ("window-doubling prime sieve (window_sievie.py)",
+                     window_sieve_arguments, window_sieve),
+    "amputated": ("amputated window sieve (window_sieve_amputated.py)",
+                  amputated_arguments, window_sieve_amputated),
+    "crt": ("steps at which the congruence cycle simulator adds a cycle",
+            None, congruence_cycles),
+    "goldbach": ("Goldbach decompositions of even N <= n (goldbach_batch.py)",
+                 goldbach_arguments, goldbach),
+    "projection": ("S^S·U value projection table (selfreferential_emergence.py)",
+                   projection_arguments, projection),
+    "structural": ("structural emergence steps or ensemble (structural_emergence.py)",
+                   emergence_arguments, structural_emergence),
+    "rhythm": ("the_rhythm_is_one steps (demonstrations/the_rhythm_is_one.py)",
+               _emergence_arguments, rhythm),
+}